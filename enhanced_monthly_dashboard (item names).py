@@ -1,12 +1,26 @@
 import os
 import re
+import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from datetime import datetime, timedelta
+from functools import lru_cache
+from html import escape
+from itertools import chain
+from pathlib import Path
+from string import Template
 from urllib.parse import quote
 import webbrowser
 import json
 import random
+import heapq
+from operator import itemgetter
+
+# Shared generator for the demo fallback data
+_RNG = random.Random()
+
+# Compact JSON encoder shared by every payload embedded in the page
+_encode_json = json.JSONEncoder(separators=(',', ':')).encode
 
 def main():
     """Main function - Professional OLSTRAL BI Dashboard Generator"""
@@ -47,20 +61,20 @@ def main():
         
         print(f"📊 Found {len(reports)} reports with enhanced data extraction")
         
-        # Step 4: Generate BI dashboard
-        html_content = generate_bi_dashboard(reports, config, local_path)
-        
-        # Step 5: Save to desktop with timestamp
+        # Step 4: Generate BI dashboard, streamed section by section to desktop with timestamp
         desktop = os.path.join(os.path.expanduser("~"), "Desktop")
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         output_file = os.path.join(desktop, f"OLSTRAL_BI_Dashboard_{timestamp}.html")
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            generate_bi_dashboard(reports, config, local_path, out=f)
+        
+        if config.get('external_css'):
+            write_dashboard_css(desktop)
         
         print(f"✅ BI dashboard created: {output_file}")
         
-        # Step 6: Success message and open
+        # Step 5: Success message and open
         show_success(output_file, len(reports), config)
         
     except Exception as e:
@@ -76,7 +90,9 @@ def get_config():
         'sharepoint_base': "https://olesch.sharepoint.com/sites/Production/Production%20Planning/Production-Reports/Production-Reports(BETA)",
         'site_name': "OLSTRAL Production Reports",
         'company': "OLSTRAL",
-        'theme': 'professional-bi'
+        'theme': 'professional-bi',
+        'item_table_limit': None,  # Top N items by volume in the item table, None shows all
+        'external_css': False  # Link a shared dashboard.css next to the output instead of inlining it
     }
     
     print(f"🌐 SharePoint Base: {config['sharepoint_base']}")
@@ -416,6 +432,31 @@ def extract_comprehensive_html_data(file_path):
     except Exception as e:
         print(f"  ⚠️ Error extracting data from {file_path}: {e}")
     
+    normalize_downtime_schema(data)
+    return data
+
+def normalize_downtime_schema(data):
+    """Coerce the downtime maps and machine lists once so the dashboard loops can skip type checks"""
+    # Downtime maps: stripped, interned names mapped to numeric minutes
+    for key in ('downtime_categories', 'downtime_machines'):
+        raw = data.get(key)
+        clean = {}
+        if isinstance(raw, dict):
+            for name, minutes in raw.items():
+                if isinstance(name, str) and name.strip() and isinstance(minutes, (int, float)):
+                    name = sys.intern(name.strip())
+                    clean[name] = clean.get(name, 0) + minutes
+        data[key] = clean
+    
+    # Machine lists: dict entries only, each with a stripped, interned name ('' when missing)
+    for key, name_key in (('machine_data', 'machine'), ('top_machines', 'name')):
+        raw = data.get(key)
+        entries = [m for m in raw if isinstance(m, dict)] if isinstance(raw, list) else []
+        for machine in entries:
+            name = machine.get(name_key)
+            machine[name_key] = sys.intern(str(name).strip()) if name is not None else ''
+        data[key] = entries
+    
     return data
 
 def extract_item_data_from_table(content):
@@ -446,17 +487,17 @@ def extract_item_data_from_table(content):
                 if len(cells) >= 7:  # Ensure we have enough columns
                     # Extract machine name
                     machine_match = re.search(r'class="machine-name"[^>]*>([^<]+)', cells[0])
-                    machine = machine_match.group(1).strip() if machine_match else "Unknown"
+                    machine = sys.intern(machine_match.group(1).strip() if machine_match else "Unknown")
                     
                     # Extract operation
-                    operation = re.sub(r'<[^>]+>', '', cells[1]).strip()
+                    operation = sys.intern(re.sub(r'<[^>]+>', '', cells[1]).strip())
                     
                     # Extract item name
-                    item_name = re.sub(r'<[^>]+>', '', cells[2]).strip()
+                    item_name = sys.intern(re.sub(r'<[^>]+>', '', cells[2]).strip())
                     
                     # Extract internal order
                     order_match = re.search(r'>(\d+)<', cells[3])
-                    internal_order = order_match.group(1) if order_match else "Unknown"
+                    internal_order = sys.intern(order_match.group(1) if order_match else "Unknown")
                     
                     # Extract OK and NOK parts
                     ok_parts = extract_number(cells[4]) or 0
@@ -473,7 +514,7 @@ def extract_item_data_from_table(content):
                     oee = float(oee_match.group(1)) if oee_match else 0
                     
                     # Extract operator
-                    operator = re.sub(r'<[^>]+>', '', cells[10]).strip()
+                    operator = sys.intern(re.sub(r'<[^>]+>', '', cells[10]).strip())
                     
                     if item_name and item_name != "Unknown" and total_parts > 0:
                         item_data.append({
@@ -516,16 +557,27 @@ def extract_number(text):
     
     return None
 
+@lru_cache(maxsize=256)
+def fmt_pct(value):
+    """Format a percentage KPI for display, 'N/A' when missing or zero"""
+    return f"{value}%" if value else 'N/A'
+
+@lru_cache(maxsize=1024)
+def format_report_date(date):
+    """Return (day name, long date) for a YYYY-MM-DD string; reports sharing a date parse it once"""
+    try:
+        date_obj = datetime.strptime(date, '%Y-%m-%d')
+    except ValueError:
+        return "", date
+    return date_obj.strftime('%A'), date_obj.strftime('%B %d, %Y')
+
+_STATUS_LABELS = ('Poor', 'Fair', 'Good')
+
 def determine_status(oee):
     """Determine status based on updated OEE thresholds"""
     if oee is None:
         return 'Unknown'
-    elif oee >= 70:
-        return 'Good'
-    elif oee >= 45:
-        return 'Fair'
-    else:
-        return 'Poor'
+    return _STATUS_LABELS[(oee >= 45) + (oee >= 70)]
 
 def extract_date_from_filename(filename):
     """Enhanced date extraction"""
@@ -556,6 +608,13 @@ def extract_date_from_filename(filename):
     
     return "Unknown"
 
+def fallback_date_labels(max_days):
+    """Chart labels for the last days of the current month, ending today"""
+    current_date = datetime.now()
+    days = min(max_days, current_date.day)
+    return [(current_date - timedelta(days=offset)).strftime('%b %d')
+            for offset in range(days - 1, -1, -1)]
+
 def prepare_monthly_parts_data(current_month_reports):
     """Prepare monthly OK/NOK parts data for doughnut chart using actual data"""
     total_ok_parts = 0
@@ -591,10 +650,8 @@ def prepare_monthly_oee_data(current_month_reports):
     machine_details = []
     
     if current_month_reports:
-        # Sort reports by date
-        sorted_reports = sorted(current_month_reports, key=lambda x: x.get('date', ''))
-        
-        for report in sorted_reports:
+        # Reports arrive sorted by date from generate_bi_dashboard
+        for report in current_month_reports:
             try:
                 main_oee = report.get('main_oee')
                 if isinstance(main_oee, (int, float)):
@@ -631,13 +688,9 @@ def prepare_monthly_oee_data(current_month_reports):
                 continue
     else:
         # If no current month data, use sample data for demo
-        current_date = datetime.now()
-        for i in range(min(15, current_date.day)):
-            date = current_date.replace(day=i+1)
-            labels.append(date.strftime('%b %d'))
-            # Generate realistic OEE values based on your sample
-            import random
-            values.append(round(random.uniform(35, 85), 1))
+        labels = fallback_date_labels(15)
+        # Generate realistic OEE values based on your sample
+        values = [round(_RNG.uniform(35, 85), 1) for _ in labels]
     
     return {
         'labels': labels,
@@ -653,10 +706,8 @@ def prepare_downtime_breakdown_data(current_month_reports):
     category_breakdown = {}
     
     if current_month_reports:
-        # Sort reports by date
-        sorted_reports = sorted(current_month_reports, key=lambda x: x.get('date', ''))
-        
-        for report in sorted_reports:
+        # Reports arrive sorted by date from generate_bi_dashboard
+        for report in current_month_reports:
             try:
                 downtime_hours = report.get('downtime_hours')
                 if isinstance(downtime_hours, (int, float)):
@@ -665,17 +716,11 @@ def prepare_downtime_breakdown_data(current_month_reports):
                     values.append(float(downtime_hours))
                     
                     # Aggregate downtime by categories and machines using REAL extracted data
-                    if report.get('downtime_categories') and isinstance(report['downtime_categories'], dict):
-                        for category, minutes in report['downtime_categories'].items():
-                            if isinstance(category, str) and isinstance(minutes, (int, float)):
-                                category_key = str(category)
-                                category_breakdown[category_key] = category_breakdown.get(category_key, 0) + (float(minutes) / 60)  # Convert to hours
+                    for category, minutes in report['downtime_categories'].items():
+                        category_breakdown[category] = category_breakdown.get(category, 0) + (float(minutes) / 60)  # Convert to hours
                     
-                    if report.get('downtime_machines') and isinstance(report['downtime_machines'], dict):
-                        for machine, minutes in report['downtime_machines'].items():
-                            if isinstance(machine, str) and isinstance(minutes, (int, float)):
-                                machine_key = str(machine)
-                                machine_breakdown[machine_key] = machine_breakdown.get(machine_key, 0) + (float(minutes) / 60)  # Convert to hours
+                    for machine, minutes in report['downtime_machines'].items():
+                        machine_breakdown[machine] = machine_breakdown.get(machine, 0) + (float(minutes) / 60)  # Convert to hours
                                 
             except Exception as e:
                 print(f"  ⚠️ Error processing date {report.get('date', 'unknown')}: {e}")
@@ -684,11 +729,8 @@ def prepare_downtime_breakdown_data(current_month_reports):
     # Only use fallback if NO real data was found
     if not labels and not values:
         print("  ℹ️ No real downtime data found, using minimal fallback")
-        current_date = datetime.now()
-        for i in range(min(5, current_date.day)):
-            date = current_date.replace(day=i+1)
-            labels.append(date.strftime('%b %d'))
-            values.append(0.5)  # Minimal fallback
+        labels = fallback_date_labels(5)
+        values = [0.5] * len(labels)  # Minimal fallback
     
     return {
         'labels': labels,
@@ -697,116 +739,57 @@ def prepare_downtime_breakdown_data(current_month_reports):
         'machine_breakdown': machine_breakdown
     }
 
-def prepare_machine_downtime_data(current_month_reports):
+def collect_downtime_dimensions(current_month_reports):
+    """Collect the sorted machine and downtime category names seen across the reports"""
+    # Machines from downtime data, machine data and top machines
+    all_machines = set(chain.from_iterable(report['downtime_machines'] for report in current_month_reports))
+    all_machines.update(
+        machine.get('machine', '') for report in current_month_reports
+        for machine in report.get('machine_data', ())
+    )
+    all_machines.update(
+        machine.get('name', '') for report in current_month_reports
+        for machine in report['top_machines']
+    )
+    all_machines.discard('')
+    
+    # Real categories from downtime data
+    all_categories = set(chain.from_iterable(report['downtime_categories'] for report in current_month_reports))
+    
+    sorted_machines = sorted(all_machines)
+    sorted_categories = sorted(all_categories)
+    return sorted_machines, sorted_categories
+
+def prepare_machine_downtime_data(current_month_reports, all_machines, all_categories):
     """Prepare machine-specific downtime data for interactive filtering using REAL data"""
     machine_data = {}
-    all_categories = set()
-    all_machines = set()
     
     print("  🔧 Preparing machine downtime data...")
-    
-    # Extract REAL machine names and categories from reports
-    for report in current_month_reports:
-        try:
-            # Get machines from downtime data
-            if report.get('downtime_machines') and isinstance(report.get('downtime_machines'), dict):
-                for machine_name in report['downtime_machines'].keys():
-                    if isinstance(machine_name, str) and machine_name.strip():
-                        all_machines.add(machine_name.strip())
-                        print(f"    🏭 Found machine in {report.get('date', 'unknown')}: {machine_name}")
-            
-            # Get machines from machine data
-            if report.get('machine_data') and isinstance(report.get('machine_data'), list):
-                for machine in report['machine_data']:
-                    if isinstance(machine, dict):
-                        machine_name = machine.get('machine', '')
-                        if isinstance(machine_name, str) and machine_name.strip():
-                            all_machines.add(machine_name.strip())
-            
-            # Get machines from top machines
-            if report.get('top_machines') and isinstance(report.get('top_machines'), list):
-                for machine in report['top_machines']:
-                    if isinstance(machine, dict):
-                        machine_name = machine.get('name', '')
-                        if isinstance(machine_name, str) and machine_name.strip():
-                            all_machines.add(machine_name.strip())
-            
-            # Get real categories from downtime data
-            if report.get('downtime_categories') and isinstance(report.get('downtime_categories'), dict):
-                for category_name in report['downtime_categories'].keys():
-                    if isinstance(category_name, str) and category_name.strip():
-                        all_categories.add(category_name.strip())
-                        print(f"    📋 Found category in {report.get('date', 'unknown')}: {category_name}")
-        
-        except Exception as e:
-            print(f"  ⚠️ Error processing report {report.get('date', 'unknown')}: {e}")
-            continue
-    
     print(f"  📊 Total unique machines found: {len(all_machines)}")
     print(f"  📊 Total unique categories found: {len(all_categories)}")
-    print(f"  🏭 All machines: {sorted(list(all_machines))}")
-    print(f"  📋 All categories: {sorted(list(all_categories))}")
+    print(f"  🏭 All machines: {all_machines}")
+    print(f"  📋 All categories: {all_categories}")
+    
+    # Category minutes per report, shared by every machine's proportional split
+    category_minutes = [sum(report['downtime_categories'].values()) for report in current_month_reports]
     
     # Build machine-specific downtime data using REAL extracted data
     for machine in all_machines:
-        try:
-            machine_data[machine] = {}
-            
-            # Initialize categories for this machine
-            for category in all_categories:
-                machine_data[machine][category] = []
+        machine_data[machine] = series = {category: [] for category in all_categories}
+        
+        for report, total_category_minutes in zip(current_month_reports, category_minutes):
+            categories = report['downtime_categories']
+            machine_downtime_total = report['downtime_machines'].get(machine, 0) / 60  # Convert to hours
             
-            # Populate with real data from reports
-            for report in current_month_reports:
-                try:
-                    # If this machine has downtime data in this report
-                    machine_downtime_total = 0
-                    if (report.get('downtime_machines') and 
-                        isinstance(report['downtime_machines'], dict) and 
-                        machine in report['downtime_machines']):
-                        downtime_value = report['downtime_machines'][machine]
-                        if isinstance(downtime_value, (int, float)):
-                            machine_downtime_total = downtime_value / 60  # Convert to hours
-                    
-                    # Distribute downtime across categories proportionally
-                    if (report.get('downtime_categories') and 
-                        isinstance(report['downtime_categories'], dict) and 
-                        machine_downtime_total > 0):
-                        
-                        total_category_minutes = sum(
-                            v for v in report['downtime_categories'].values() 
-                            if isinstance(v, (int, float))
-                        )
-                        
-                        for category in all_categories:
-                            if (category in report['downtime_categories'] and 
-                                total_category_minutes > 0):
-                                category_value = report['downtime_categories'][category]
-                                if isinstance(category_value, (int, float)):
-                                    category_proportion = category_value / total_category_minutes
-                                    machine_category_downtime = machine_downtime_total * category_proportion
-                                    machine_data[machine][category].append(round(machine_category_downtime, 1))
-                                else:
-                                    machine_data[machine][category].append(0.0)
-                            else:
-                                machine_data[machine][category].append(0.0)
-                    else:
-                        # No downtime for this machine on this date
-                        for category in all_categories:
-                            machine_data[machine][category].append(0.0)
-                            
-                except Exception as e:
-                    print(f"    ⚠️ Error processing report {report.get('date', 'unknown')} for machine {machine}: {e}")
-                    # Add zeros for this report if there's an error
-                    for category in all_categories:
-                        if category not in machine_data[machine]:
-                            machine_data[machine][category] = []
-                        machine_data[machine][category].append(0.0)
-                    continue
-                    
-        except Exception as e:
-            print(f"  ⚠️ Error setting up machine {machine}: {e}")
-            continue
+            # Distribute downtime across categories proportionally
+            if machine_downtime_total > 0 and total_category_minutes > 0:
+                for category in all_categories:
+                    category_proportion = categories.get(category, 0) / total_category_minutes
+                    series[category].append(round(machine_downtime_total * category_proportion, 1))
+            else:
+                # No downtime for this machine on this date
+                for category in all_categories:
+                    series[category].append(0.0)
     
     # If no real data found, create minimal structure
     if not machine_data:
@@ -826,15 +809,8 @@ def prepare_category_breakdown_data(current_month_reports):
     category_totals = {}
     
     for report in current_month_reports:
-        try:
-            if report.get('downtime_categories') and isinstance(report.get('downtime_categories'), dict):
-                for category, minutes in report['downtime_categories'].items():
-                    if isinstance(category, str) and isinstance(minutes, (int, float)):
-                        category_key = str(category).strip()
-                        category_totals[category_key] = category_totals.get(category_key, 0) + (float(minutes) / 60)  # Convert to hours
-        except Exception as e:
-            print(f"Error processing category data for report {report.get('date', 'unknown')}: {e}")
-            continue
+        for category, minutes in report['downtime_categories'].items():
+            category_totals[category] = category_totals.get(category, 0) + (float(minutes) / 60)  # Convert to hours
     
     # If no data, create sample data
     if not category_totals:
@@ -848,8 +824,26 @@ def prepare_category_breakdown_data(current_month_reports):
     
     return category_totals
 
-def prepare_item_analysis_data(current_month_reports):
-    """NEW: Prepare item-level analysis data for the new section"""
+def prepare_machine_oee_data(current_month_reports):
+    """Average each machine's OEE over the month's top-machine lists, best first, for the machine chart"""
+    oee_totals = {}  # name -> [oee sum, sample count]
+    
+    for report in current_month_reports:
+        for machine in report['top_machines']:
+            oee = machine.get('oee')
+            if isinstance(oee, (int, float)):
+                totals = oee_totals.get(machine['name'])
+                if totals is None:
+                    oee_totals[machine['name']] = totals = [0.0, 0]
+                totals[0] += oee
+                totals[1] += 1
+    
+    machine_oee = [{'name': name, 'oee': total / count} for name, (total, count) in oee_totals.items()]
+    machine_oee.sort(key=itemgetter('oee'), reverse=True)
+    return machine_oee
+
+def prepare_item_analysis_data(current_month_reports, limit=None):
+    """NEW: Prepare item-level analysis data for the new section, optionally capped to the top `limit` items"""
     item_aggregates = {}
     
     print("  🔧 Preparing item analysis data...")
@@ -865,8 +859,9 @@ def prepare_item_analysis_data(current_month_reports):
                         if not item_name:
                             continue
                         
-                        if item_name not in item_aggregates:
-                            item_aggregates[item_name] = {
+                        agg = item_aggregates.get(item_name)
+                        if agg is None:
+                            agg = item_aggregates[item_name] = {
                                 'total_ok': 0,
                                 'total_nok': 0,
                                 'total_parts': 0,
@@ -875,34 +870,43 @@ def prepare_item_analysis_data(current_month_reports):
                                 'orders': set(),
                                 'operations': set(),
                                 'report_count': 0,
-                                'oee_values': [],
+                                'oee_sum': 0.0,
+                                'oee_count': 0,
                                 'dates': set(),  # NEW: Track dates
                                 'date_details': []  # NEW: Track production per date
                             }
                         
                         # Aggregate data
-                        item_aggregates[item_name]['total_ok'] += item.get('ok_parts', 0)
-                        item_aggregates[item_name]['total_nok'] += item.get('nok_parts', 0)
-                        item_aggregates[item_name]['total_parts'] += item.get('total_parts', 0)
-                        item_aggregates[item_name]['machines'].add(item.get('machine', ''))
-                        item_aggregates[item_name]['operators'].add(item.get('operator', ''))
-                        item_aggregates[item_name]['orders'].add(item.get('internal_order', ''))
-                        item_aggregates[item_name]['operations'].add(item.get('operation', ''))
-                        item_aggregates[item_name]['report_count'] += 1
-                        item_aggregates[item_name]['dates'].add(report_date)  # NEW: Add date
+                        ok_parts = item.get('ok_parts', 0)
+                        nok_parts = item.get('nok_parts', 0)
+                        total_parts = item.get('total_parts', 0)
+                        oee = item.get('oee', 0)
+                        agg['total_ok'] += ok_parts
+                        agg['total_nok'] += nok_parts
+                        agg['total_parts'] += total_parts
+                        agg['report_count'] += 1
+                        agg['dates'].add(report_date)  # NEW: Add date
+                        
+                        # Only non-blank names count towards the distinct machine/operator/order/operation totals
+                        for key, field in (('machines', 'machine'), ('operators', 'operator'),
+                                           ('orders', 'internal_order'), ('operations', 'operation')):
+                            value = item.get(field, '')
+                            if value.strip():
+                                agg[key].add(value)
                         
                         # NEW: Add detailed date information
-                        item_aggregates[item_name]['date_details'].append({
+                        agg['date_details'].append({
                             'date': report_date,
-                            'ok_parts': item.get('ok_parts', 0),
-                            'nok_parts': item.get('nok_parts', 0),
-                            'total_parts': item.get('total_parts', 0),
+                            'ok_parts': ok_parts,
+                            'nok_parts': nok_parts,
+                            'total_parts': total_parts,
                             'quality_rate': item.get('quality_rate', 0),
-                            'oee': item.get('oee', 0)
+                            'oee': oee
                         })
                         
-                        if item.get('oee', 0) > 0:
-                            item_aggregates[item_name]['oee_values'].append(item.get('oee', 0))
+                        if oee > 0:
+                            agg['oee_sum'] += oee
+                            agg['oee_count'] += 1
                             
         except Exception as e:
             print(f"  ⚠️ Error processing item data for report {report.get('date', 'unknown')}: {e}")
@@ -915,7 +919,7 @@ def prepare_item_analysis_data(current_month_reports):
             total_parts = data['total_parts']
             if total_parts > 0:
                 quality_rate = (data['total_ok'] / total_parts) * 100
-                avg_oee = sum(data['oee_values']) / len(data['oee_values']) if data['oee_values'] else 0
+                avg_oee = data['oee_sum'] / data['oee_count'] if data['oee_count'] else 0
                 
                 # NEW: Prepare date information for filtering
                 dates_list = sorted(list(data['dates']))
@@ -929,10 +933,10 @@ def prepare_item_analysis_data(current_month_reports):
                     'nok_parts': data['total_nok'],
                     'quality_rate': round(quality_rate, 1),
                     'avg_oee': round(avg_oee, 1),
-                    'machine_count': len([m for m in data['machines'] if m.strip()]),
-                    'operator_count': len([o for o in data['operators'] if o.strip()]),
-                    'order_count': len([ord for ord in data['orders'] if ord.strip()]),
-                    'operation_count': len([op for op in data['operations'] if op.strip()]),
+                    'machine_count': len(data['machines']),
+                    'operator_count': len(data['operators']),
+                    'order_count': len(data['orders']),
+                    'operation_count': len(data['operations']),
                     'report_count': data['report_count'],
                     'dates': dates_list,  # NEW: All dates this item was produced
                     'first_date': first_date,  # NEW: First production date
@@ -943,173 +947,18 @@ def prepare_item_analysis_data(current_month_reports):
             print(f"  ⚠️ Error calculating metrics for item {item_name}: {e}")
             continue
     
-    # Sort by total parts (descending)
-    item_analysis.sort(key=lambda x: x['total_parts'], reverse=True)
+    # Sort by total parts (descending); a heap keeps only the top items when a limit is set
+    if limit and len(item_analysis) > limit:
+        item_analysis = heapq.nlargest(limit, item_analysis, key=itemgetter('total_parts'))
+    else:
+        item_analysis.sort(key=itemgetter('total_parts'), reverse=True)
     
     print(f"  ✅ Successfully prepared analysis for {len(item_analysis)} unique items")
     return item_analysis
 
-def generate_bi_dashboard(reports, config, local_path):
-    """Generate professional BI dashboard with red theme"""
-    
-    # Calculate current month statistics
-    current_month = datetime.now().strftime('%Y-%m')
-    current_month_name = datetime.now().strftime('%B %Y')
-    
-    # Filter reports for current month
-    current_month_reports = [r for r in reports if r['date'].startswith(current_month)]
-    
-    # Calculate current month averages
-    current_month_oee_values = [r['main_oee'] for r in current_month_reports if r['main_oee'] is not None]
-    current_month_avg_oee = round(sum(current_month_oee_values) / len(current_month_oee_values), 1) if current_month_oee_values else None
-    
-    current_month_quality_values = [r['quality_rate'] for r in current_month_reports if r['quality_rate'] is not None]
-    current_month_avg_quality = round(sum(current_month_quality_values) / len(current_month_quality_values), 1) if current_month_quality_values else None
-    
-    current_month_total_parts = sum([r['total_parts'] for r in current_month_reports if r['total_parts'] is not None])
-    
-    current_month_downtime_values = [r['downtime_hours'] for r in current_month_reports if r['downtime_hours'] is not None]
-    current_month_total_downtime = sum(current_month_downtime_values) if current_month_downtime_values else 0
-    
-    # Prepare monthly OK/NOK parts data for doughnut chart
-    monthly_parts_data = prepare_monthly_parts_data(current_month_reports)
-    
-    # Prepare monthly OEE data for chart
-    monthly_oee_data = prepare_monthly_oee_data(current_month_reports)
-    
-    # Prepare downtime breakdown data
-    downtime_breakdown_data = prepare_downtime_breakdown_data(current_month_reports)
-    
-    # Prepare machine downtime data for interactive section
-    machine_downtime_data = prepare_machine_downtime_data(current_month_reports)
-    
-    # Prepare category breakdown data for new chart
-    category_breakdown_data = prepare_category_breakdown_data(current_month_reports)
-    
-    # NEW: Prepare item analysis data
-    item_analysis_data = prepare_item_analysis_data(current_month_reports)
-    
-    # Group by folders
-    folders = {}
-    for report in reports:
-        folder = report['parent_folder']
-        if folder not in folders:
-            folders[folder] = []
-        folders[folder].append(report)
-    
-    # Safely prepare JSON data for JavaScript
-    try:
-        monthly_oee_json = json.dumps(monthly_oee_data)
-    except Exception as e:
-        print(f"Error serializing monthly OEE data: {e}")
-        monthly_oee_json = '{"labels": [], "values": [], "machine_details": []}'
-        
-    try:
-        monthly_parts_json = json.dumps(monthly_parts_data)
-    except Exception as e:
-        print(f"Error serializing monthly parts data: {e}")
-        monthly_parts_json = '{"ok_parts": 0, "nok_parts": 0}'
-        
-    try:
-        downtime_breakdown_json = json.dumps(downtime_breakdown_data)
-    except Exception as e:
-        print(f"Error serializing downtime breakdown data: {e}")
-        downtime_breakdown_json = '{"labels": [], "values": [], "category_breakdown": {}, "machine_breakdown": {}}'
-        
-    try:
-        machine_downtime_json = json.dumps(machine_downtime_data)
-    except Exception as e:
-        print(f"Error serializing machine downtime data: {e}")
-        machine_downtime_json = '{}'
-    
-    try:
-        category_breakdown_json = json.dumps(category_breakdown_data)
-    except Exception as e:
-        print(f"Error serializing category breakdown data: {e}")
-        category_breakdown_json = '{}'
-    
-    try:
-        item_analysis_json = json.dumps(item_analysis_data)
-    except Exception as e:
-        print(f"Error serializing item analysis data: {e}")
-        item_analysis_json = '[]'
-    
-    # Prepare safe current month reports for JavaScript
-    safe_reports = []
-    for r in current_month_reports:
-        try:
-            safe_report = {
-                'date': str(r.get('date', '')),
-                'top_machines': [],
-                'top_operators': [],
-                'downtime_categories': {},
-                'downtime_machines': {},
-                'downtime_hours': 0
-            }
-            
-            # Safely process top_machines
-            if isinstance(r.get('top_machines'), list):
-                for machine in r['top_machines']:
-                    if isinstance(machine, dict):
-                        name = machine.get('name', '')
-                        oee = machine.get('oee', 0)
-                        if isinstance(name, str) and isinstance(oee, (int, float)):
-                            safe_report['top_machines'].append({
-                                'name': str(name),
-                                'oee': float(oee)
-                            })
-            
-            # Safely process top_operators
-            if isinstance(r.get('top_operators'), list):
-                for operator in r['top_operators']:
-                    if isinstance(operator, dict):
-                        name = operator.get('name', '')
-                        oee = operator.get('oee', 0)
-                        if isinstance(name, str) and isinstance(oee, (int, float)):
-                            safe_report['top_operators'].append({
-                                'name': str(name),
-                                'oee': float(oee)
-                            })
-            
-            # Safely process downtime_categories
-            if isinstance(r.get('downtime_categories'), dict):
-                for key, value in r['downtime_categories'].items():
-                    if isinstance(key, str) and isinstance(value, (int, float)):
-                        safe_report['downtime_categories'][str(key)] = float(value)
-            
-            # Safely process downtime_machines
-            if isinstance(r.get('downtime_machines'), dict):
-                for key, value in r['downtime_machines'].items():
-                    if isinstance(key, str) and isinstance(value, (int, float)):
-                        safe_report['downtime_machines'][str(key)] = float(value)
-            
-            # Safely process downtime_hours
-            downtime_hours = r.get('downtime_hours', 0)
-            if isinstance(downtime_hours, (int, float)):
-                safe_report['downtime_hours'] = float(downtime_hours)
-            
-            safe_reports.append(safe_report)
-            
-        except Exception as e:
-            print(f"Error processing report for JSON: {e}")
-            # Add a minimal safe report
-            safe_reports.append({
-                'date': str(r.get('date', 'unknown')),
-                'top_machines': [],
-                'top_operators': [],
-                'downtime_categories': {},
-                'downtime_machines': {},
-                'downtime_hours': 0
-            })
-    
-    try:
-        current_month_reports_json = json.dumps(safe_reports)
-    except Exception as e:
-        print(f"Error serializing current month reports: {e}")
-        current_month_reports_json = '[]'
-    
-    # Build HTML structure
-    html = f"""<!DOCTYPE html>
+# Static page pieces, built once at import. The templated sections are filled per dashboard
+# with string.Template, so the CSS and markup need no brace escaping.
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1118,865 +967,80 @@ def generate_bi_dashboard(reports, config, local_path):
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
     <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/chartjs-plugin-annotation/1.4.0/chartjs-plugin-annotation.min.js"></script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #f8f9fa;
-            min-height: 100vh;
-            padding: 20px;
-            color: #2c3e50;
-        }}
-        
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.1);
-            overflow: hidden;
-            border: 1px solid #e9ecef;
-        }}
-        
-        /* Red-themed Header */
-        .header {{
-            background: linear-gradient(135deg, #dc2626 0%, #b91c1c 100%);
-            color: white;
-            padding: 30px 40px;
-            border-bottom: 4px solid #ef4444;
-        }}
-        
-        .header-content {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 20px;
-        }}
-        
-        .header-left {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-        }}
-        
-        .company-logo {{
-            background: rgba(255, 255, 255, 0.15);
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-size: 1.5rem;
-            font-weight: bold;
-            letter-spacing: 2px;
-            border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        
-        .header-title {{
-            font-size: 2.2rem;
-            font-weight: 600;
-            margin: 0;
-        }}
-        
-        .header-right {{
-            text-align: right;
-            font-size: 0.95rem;
-            opacity: 0.9;
-        }}
-        
-        .last-updated {{
-            margin-bottom: 5px;
-        }}
-        
-        .report-period {{
-            font-weight: 600;
-        }}
-        
-        /* Red-themed KPI Cards Grid (3 cards only) */
-        .kpi-grid {{
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 25px;
-            padding: 40px;
-            background: #f8f9fa;
-        }}
-        
-        .kpi-card {{
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 30px;
-            text-align: center;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            transition: all 0.3s ease;
-            border-left: 4px solid transparent;
-        }}
-        
-        .kpi-card:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-        }}
-        
-        .kpi-card.oee {{ border-left-color: #dc2626; }}
-        .kpi-card.quality {{ border-left-color: #dc2626; }}
-        .kpi-card.parts {{ border-left-color: #dc2626; }}
-        
-        .kpi-icon {{
-            font-size: 2.5rem;
-            margin-bottom: 15px;
-            color: #dc2626;
-        }}
-        
-        .kpi-value {{
-            font-size: 2.8rem;
-            font-weight: 700;
-            margin-bottom: 8px;
-            color: #2c3e50;
-        }}
-        
-        .kpi-label {{
-            color: #7f8c8d;
-            font-size: 1rem;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .kpi-period {{
-            color: #95a5a6;
-            font-size: 0.85rem;
-            margin-top: 5px;
-            font-style: italic;
-        }}
-        
-        /* Analytics Section */
-        .analytics-section {{
-            padding: 40px;
-            background: #ffffff;
-        }}
-        
-        .section-title {{
-            font-size: 1.8rem;
-            color: #2c3e50;
-            margin-bottom: 30px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #dc2626;
-            font-weight: 600;
-        }}
-        
-        .charts-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-            margin-bottom: 40px;
-        }}
-        
-        .charts-triple-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr 1fr;
-            gap: 30px;
-            margin-bottom: 40px;
-        }}
-        
-        .chart-container {{
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 25px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            border: 1px solid #e9ecef;
-        }}
-        
-        .chart-title {{
-            font-size: 1.2rem;
-            color: #2c3e50;
-            margin-bottom: 20px;
-            text-align: center;
-            font-weight: 600;
-        }}
-        
-        .chart-wrapper {{
-            position: relative;
-            height: 450px;
-        }}
-        
-        .chart-wrapper-small {{
-            position: relative;
-            height: 350px;
-        }}
-        
-        /* NEW: Item Analysis Section */
-        .item-analysis-section {{
-            padding: 40px;
-            background: #f8f9fa;
-            border-top: 1px solid #e9ecef;
-        }}
-        
-        .item-controls {{
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 25px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            border: 1px solid #e9ecef;
-        }}
-        
-        .item-filters {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
-        
-        .item-filter-group {{
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        .item-filter-label {{
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .item-filter-input {{
-            background: #ffffff;
-            border: 2px solid #dc2626;
-            border-radius: 8px;
-            padding: 12px 15px;
-            font-size: 14px;
-            color: #2c3e50;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }}
-        
-        .item-filter-input:focus {{
-            outline: none;
-            border-color: #ef4444;
-            box-shadow: 0 0 0 3px rgba(220, 38, 38, 0.1);
-        }}
-        
-        .item-quick-filters {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-            gap: 10px;
-        }}
-        
-        .item-filter-btn {{
-            background: #ecf0f1;
-            color: #2c3e50;
-            border: 2px solid #dc2626;
-            padding: 10px 15px;
-            border-radius: 6px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.85rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .item-filter-btn:hover,
-        .item-filter-btn.active {{
-            background: #dc2626;
-            color: white;
-        }}
-        
-        .item-table-container {{
-            background: #ffffff;
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            border: 1px solid #e9ecef;
-        }}
-        
-        .item-table {{
-            width: 100%;
-            border-collapse: collapse;
-        }}
-        
-        .item-table th {{
-            background: linear-gradient(135deg, #dc2626 0%, #b91c1c 100%);
-            color: white;
-            padding: 15px 12px;
-            text-align: left;
-            font-weight: 600;
-            font-size: 0.9rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .item-table td {{
-            padding: 12px;
-            border-bottom: 1px solid rgba(220, 38, 38, 0.1);
-            font-size: 0.9rem;
-            color: #2c3e50;
-        }}
-        
-        .item-table tbody tr:hover {{
-            background: rgba(220, 38, 38, 0.05);
-        }}
-        
-        .item-table tbody tr:nth-child(even) {{
-            background: #f8f9fa;
-        }}
-        
-        .item-name {{
-            font-weight: 600;
-            color: #2c3e50;
-            max-width: 300px;
-            word-wrap: break-word;
-        }}
-        
-        .item-parts {{
-            font-weight: 600;
-            color: #dc2626;
-        }}
-        
-        .item-quality {{
-            font-weight: 600;
-            padding: 4px 8px;
-            border-radius: 4px;
-            text-align: center;
-        }}
-        
-        .quality-excellent {{
-            background: rgba(39, 174, 96, 0.1);
-            color: #27ae60;
-        }}
-        
-        .quality-good {{
-            background: rgba(243, 156, 18, 0.1);
-            color: #f39c12;
-        }}
-        
-        .quality-poor {{
-            background: rgba(231, 76, 60, 0.1);
-            color: #e74c3c;
-        }}
-        
-        .item-oee {{
-            font-weight: 600;
-        }}
-        
-        .oee-excellent {{ color: #27ae60; }}
-        .oee-good {{ color: #f39c12; }}
-        .oee-poor {{ color: #e74c3c; }}
-        
-        .item-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 25px;
-        }}
-        
-        .item-stat-card {{
-            background: #ffffff;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-            border-left: 4px solid #dc2626;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        }}
-        
-        .item-stat-value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #dc2626;
-            margin-bottom: 5px;
-        }}
-        
-        .item-stat-label {{
-            color: #7f8c8d;
-            font-size: 0.9rem;
-            font-weight: 500;
-            text-transform: uppercase;
-        }}
-        
-        /* Interactive Downtime Section */
-        .downtime-section {{
-            background: #f8f9fa;
-            padding: 40px;
-            border-top: 1px solid #e9ecef;
-        }}
-        
-        .downtime-controls {{
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 25px;
-            margin-bottom: 25px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            border: 1px solid #e9ecef;
-        }}
-        
-        .controls-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }}
-        
-        .control-group {{
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        .control-label {{
-            font-size: 0.9rem;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .control-select {{
-            background: #ffffff;
-            border: 2px solid #dc2626;
-            border-radius: 8px;
-            padding: 12px 15px;
-            font-size: 14px;
-            color: #2c3e50;
-            font-weight: 500;
-            transition: all 0.3s ease;
-            cursor: pointer;
-        }}
-        
-        .control-select:focus {{
-            outline: none;
-            border-color: #ef4444;
-            box-shadow: 0 0 0 3px rgba(220, 38, 38, 0.1);
-        }}
-        
-        .refresh-btn {{
-            background: #dc2626;
-            color: white;
-            border: none;
-            padding: 12px 25px;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 1rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            align-self: end;
-        }}
-        
-        .refresh-btn:hover {{
-            background: #b91c1c;
-            transform: translateY(-2px);
-        }}
-        
-        .downtime-container {{
-            background: #ffffff;
-            border-radius: 12px;
-            padding: 25px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            border: 1px solid #e9ecef;
-        }}
-        
-        .downtime-stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 25px;
-        }}
-        
-        .downtime-stat {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-            border-left: 4px solid #dc2626;
-        }}
-        
-        .downtime-stat-value {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #dc2626;
-            margin-bottom: 5px;
-        }}
-        
-        .downtime-stat-label {{
-            color: #7f8c8d;
-            font-size: 0.9rem;
-            font-weight: 500;
-            text-transform: uppercase;
-        }}
-        
-        /* Controls */
-        .controls {{
-            background: #f8f9fa;
-            border-radius: 12px;
-            padding: 30px;
-            margin: 25px 40px;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            border: 1px solid #e9ecef;
-        }}
-        
-        .controls-title {{
-            font-size: 1.4rem;
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-weight: 600;
-        }}
-        
-        .date-filters {{
-            background: #ffffff;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 25px;
-            border: 1px solid #e9ecef;
-        }}
-        
-        .date-selector {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }}
-        
-        .date-input-group {{
-            position: relative;
-        }}
-        
-        .date-label {{
-            display: block;
-            color: #7f8c8d;
-            font-size: 0.9rem;
-            font-weight: 600;
-            margin-bottom: 5px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .date-picker {{
-            width: 100%;
-            background: #ffffff;
-            border: 2px solid #dc2626;
-            border-radius: 8px;
-            padding: 12px 15px;
-            font-size: 14px;
-            color: #2c3e50;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }}
-        
-        .date-picker:focus {{
-            outline: none;
-            border-color: #ef4444;
-            box-shadow: 0 0 0 3px rgba(220, 38, 38, 0.1);
-        }}
-        
-        .quick-filters {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-            gap: 10px;
-            margin-bottom: 15px;
-        }}
-        
-        .quick-filter-btn {{
-            background: #ecf0f1;
-            color: #2c3e50;
-            border: 2px solid #dc2626;
-            padding: 10px 15px;
-            border-radius: 6px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.85rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .quick-filter-btn:hover {{
-            background: #dc2626;
-            color: white;
-        }}
-        
-        .quick-filter-btn.active {{
-            background: #dc2626;
-            color: white;
-        }}
-        
-        .apply-filters-btn {{
-            width: 100%;
-            background: #dc2626;
-            color: white;
-            border: none;
-            padding: 12px 20px;
-            border-radius: 8px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 1rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .apply-filters-btn:hover {{
-            background: #b91c1c;
-            transform: translateY(-2px);
-        }}
-        
-        .advanced-filters {{
-            display: flex;
-            gap: 12px;
-            margin-bottom: 20px;
-            flex-wrap: wrap;
-            justify-content: center;
-        }}
-        
-        .filter-btn {{
-            background: #ecf0f1;
-            color: #2c3e50;
-            border: 2px solid #dc2626;
-            padding: 10px 18px;
-            border-radius: 6px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-size: 0.85rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .filter-btn:hover {{
-            background: #dc2626;
-            color: white;
-        }}
-        
-        .filter-btn.active {{
-            background: #dc2626;
-            color: white;
-        }}
-        
-        .search-box {{
-            width: 100%;
-            padding: 15px 20px;
-            font-size: 16px;
-            border: 2px solid #dc2626;
-            border-radius: 8px;
-            outline: none;
-            transition: all 0.3s ease;
-            background: #ffffff;
-            color: #2c3e50;
-            font-weight: 500;
-        }}
-        
-        .search-box:focus {{
-            border-color: #ef4444;
-            box-shadow: 0 0 0 3px rgba(220, 38, 38, 0.1);
-        }}
-        
-        /* Report Cards */
-        .reports-container {{
-            padding: 0 40px 40px 40px;
-        }}
-        
-        .folder-section {{
-            margin-bottom: 30px;
-        }}
-        
-        .folder-header {{
-            background: #dc2626;
-            color: white;
-            border-radius: 8px 8px 0 0;
-            padding: 20px 25px;
-            border-bottom: 3px solid #ef4444;
-        }}
-        
-        .folder-title {{
-            font-size: 1.3rem;
-            font-weight: 600;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }}
-        
-        .reports-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(400px, 1fr));
-            gap: 25px;
-            background: #f8f9fa;
-            border-radius: 0 0 8px 8px;
-            padding: 30px;
-        }}
-        
-        .report-card {{
-            background: #ffffff;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 8px rgba(0, 0, 0, 0.08);
-            transition: all 0.3s ease;
-            border: 1px solid #e9ecef;
-        }}
-        
-        .report-card:hover {{
-            transform: translateY(-4px);
-            box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-        }}
-        
-        .report-header {{
-            background: #2c3e50;
-            color: white;
-            padding: 20px;
-            position: relative;
-        }}
-        
-        .report-date {{
-            font-size: 1.3rem;
-            font-weight: 600;
-            margin-bottom: 5px;
-        }}
-        
-        .report-day {{
-            opacity: 0.8;
-            font-size: 0.9rem;
-            font-weight: 400;
-        }}
-        
-        .report-status {{
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            padding: 6px 12px;
-            border-radius: 15px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-        
-        .status-good {{ background: #27ae60; color: white; }}
-        .status-fair {{ background: #f39c12; color: white; }}
-        .status-poor {{ background: #e74c3c; color: white; }}
-        .status-unknown {{ background: #95a5a6; color: white; }}
-        
-        .report-body {{
-            padding: 25px;
-        }}
-        
-        .report-title {{
-            font-size: 1.1rem;
-            color: #2c3e50;
-            margin-bottom: 15px;
-            font-weight: 600;
-        }}
-        
-        .metrics-grid {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 12px;
-            margin-bottom: 20px;
-        }}
-        
-        .metric-item {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 12px;
-            text-align: center;
-            border: 1px solid #e9ecef;
-        }}
-        
-        .metric-value {{
-            font-size: 1.4rem;
-            font-weight: 700;
-            color: #2c3e50;
-            margin-bottom: 3px;
-        }}
-        
-        .metric-label {{
-            color: #7f8c8d;
-            font-size: 0.8rem;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .main-oee {{
-            background: linear-gradient(135deg, #ffeaea 0%, #fee2e2 100%);
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 15px;
-            border-left: 4px solid #dc2626;
-            text-align: center;
-        }}
-        
-        .main-oee-value {{
-            font-size: 2.2rem;
-            font-weight: 700;
-            margin-bottom: 5px;
-            color: #dc2626;
-        }}
-        
-        .main-oee-label {{
-            color: #7f8c8d;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            font-size: 0.9rem;
-        }}
-        
-        .report-actions {{
-            display: flex;
-            gap: 12px;
-        }}
-        
-        .report-link {{
-            flex: 1;
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            background: #dc2626;
-            color: white;
-            padding: 12px 20px;
-            text-decoration: none;
-            border-radius: 6px;
-            transition: all 0.3s ease;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            font-size: 0.9rem;
-        }}
-        
-        .report-link:hover {{
-            background: #b91c1c;
-            transform: translateY(-2px);
-        }}
-        
-        .report-link i {{
-            margin-left: 6px;
-        }}
-        
-        .no-results {{
-            text-align: center;
-            padding: 60px 20px;
-            color: #7f8c8d;
-            font-size: 1.2rem;
-            display: none;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header-content {{ flex-direction: column; text-align: center; }}
-            .header-title {{ font-size: 1.8rem; }}
-            .kpi-grid {{ grid-template-columns: 1fr; }}
-            .reports-grid {{ grid-template-columns: 1fr; }}
-            .date-selector {{ grid-template-columns: 1fr; }}
-            .quick-filters {{ grid-template-columns: repeat(2, 1fr); }}
-            .advanced-filters {{ justify-content: flex-start; }}
-            .metrics-grid {{ grid-template-columns: 1fr; }}
-            .charts-grid {{ grid-template-columns: 1fr; }}
-            .charts-triple-grid {{ grid-template-columns: 1fr; }}
-            .controls-grid {{ grid-template-columns: 1fr; }}
-            .item-filters {{ grid-template-columns: 1fr; }}
-            .item-quick-filters {{ grid-template-columns: repeat(2, 1fr); }}
-        }}
-    </style>
+"""
+
+# Filter classes for the fixed OEE and quality buttons, matched by the #filterRules stylesheet
+_REPORT_OEE_FILTER_CLASSES = ('filter-oee-poor', 'filter-oee-fair', 'filter-oee-good')
+
+def report_filter_classes(main_oee, quality_rate):
+    """Filter classes for a report card: its OEE level (none without OEE) and high quality (>= 95%)"""
+    classes = []
+    if main_oee is not None and main_oee > 0:
+        classes.append(_REPORT_OEE_FILTER_CLASSES[(main_oee >= 45) + (main_oee >= 70)])
+    if quality_rate is not None and quality_rate >= 95:
+        classes.append('filter-quality-high')
+    return classes
+
+# One report card; filled per report with str.format
+_REPORT_CARD_TEMPLATE = """
+                <div class="report-card{filter_classes}" 
+                     data-date="{date}" 
+                     data-search="{filename}">
+                    
+                    <div class="report-header">
+                        <div class="report-status status-{status_lower}">{status_upper}</div>
+                        <div class="report-date">{date}</div>
+                        <div class="report-day">{day_name}</div>
+                    </div>
+                    
+                    <div class="report-body">
+                        <div class="report-title">{title}</div>
+                        
+                        <div class="main-oee">
+                            <div class="main-oee-value">{oee_display}{oee_unit}</div>
+                            <div class="main-oee-label">OEE Performance</div>
+                        </div>
+                        
+                        <div class="metrics-grid">
+                            <div class="metric-item">
+                                <div class="metric-value">{parts_display}</div>
+                                <div class="metric-label">Total Parts</div>
+                            </div>
+                            <div class="metric-item">
+                                <div class="metric-value">{ok_display}</div>
+                                <div class="metric-label">OK Parts</div>
+                            </div>
+                            <div class="metric-item">
+                                <div class="metric-value">{quality_display}{quality_unit}</div>
+                                <div class="metric-label">Quality Rate</div>
+                            </div>
+                            <div class="metric-item">
+                                <div class="metric-value">{downtime_display}{downtime_unit}</div>
+                                <div class="metric-label">Downtime</div>
+                            </div>
+                        </div>
+                        
+                        <div class="report-actions">
+                            <a href="{sharepoint_url}" class="report-link" target="_blank">
+                                <i class="fab fa-microsoft"></i> Open Report <i class="fas fa-external-link-alt"></i>
+                            </a>
+                        </div>
+                    </div>
+                </div>"""
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+# Dashboard stylesheet, shipped next to this script and minified once at import
+DASHBOARD_CSS_PATH = Path(__file__).with_name('dashboard.css')
+_DASHBOARD_CSS = minify_css(DASHBOARD_CSS_PATH.read_text(encoding='utf-8'))
+
+_HEADER_TEMPLATE = Template("""    <style id="filterRules"></style>
 </head>
 <body>
     <div class="container">
@@ -1987,46 +1051,35 @@ def generate_bi_dashboard(reports, config, local_path):
                     <h1 class="header-title"><i class="fas fa-chart-bar"></i> Production BI Dashboard</h1>
                 </div>
                 <div class="header-right">
-                    <div class="last-updated">Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}</div>
-                    <div class="report-period">Reporting Period: {current_month_name}</div>
+                    <div class="last-updated">Last Updated: $last_updated</div>
+                    <div class="report-period">Reporting Period: $current_month_name</div>
                 </div>
             </div>
         </div>
         
-        <div class="kpi-grid">
-            <div class="kpi-card oee">
-                <div class="kpi-icon"><i class="fas fa-chart-line"></i></div>
-                <div class="kpi-value">{current_month_avg_oee if current_month_avg_oee else 'N/A'}{'%' if current_month_avg_oee else ''}</div>
-                <div class="kpi-label">Average OEE</div>
-                <div class="kpi-period">{current_month_name}</div>
-            </div>
-            <div class="kpi-card quality">
-                <div class="kpi-icon"><i class="fas fa-star"></i></div>
-                <div class="kpi-value">{current_month_avg_quality if current_month_avg_quality else 'N/A'}{'%' if current_month_avg_quality else ''}</div>
-                <div class="kpi-label">Average Quality</div>
-                <div class="kpi-period">{current_month_name}</div>
-            </div>
-            <div class="kpi-card parts">
-                <div class="kpi-icon"><i class="fas fa-cogs"></i></div>
-                <div class="kpi-value">{current_month_total_parts:,}</div>
-                <div class="kpi-label">Total Parts</div>
-                <div class="kpi-period">{current_month_name}</div>
-            </div>
-        </div>
-        
-        <!-- Analytics Section -->
+""")
+
+_KPI_CARD_TEMPLATE = Template("""
+            <div class="kpi-card $css_class">
+                <div class="kpi-icon"><i class="fas $icon"></i></div>
+                <div class="kpi-value">$value</div>
+                <div class="kpi-label">$label</div>
+                <div class="kpi-period">$period</div>
+            </div>""")
+
+_ANALYTICS_TEMPLATE = Template("""        <!-- Analytics Section -->
         <div class="analytics-section">
             <h2 class="section-title"><i class="fas fa-chart-area"></i> Monthly Performance Analytics</h2>
             
             <div class="charts-grid">
                 <div class="chart-container">
-                    <h3 class="chart-title">Daily OEE Trend - {current_month_name}</h3>
+                    <h3 class="chart-title">Daily OEE Trend - $current_month_name</h3>
                     <div class="chart-wrapper">
                         <canvas id="monthlyOeeChart"></canvas>
                     </div>
                 </div>
                 <div class="chart-container">
-                    <h3 class="chart-title">Parts Production Analysis - {current_month_name}</h3>
+                    <h3 class="chart-title">Parts Production Analysis - $current_month_name</h3>
                     <div class="chart-wrapper">
                         <canvas id="partsChart"></canvas>
                     </div>
@@ -2055,25 +1108,27 @@ def generate_bi_dashboard(reports, config, local_path):
             </div>
         </div>
         
-        <!-- NEW: Item Analysis Section -->
+""")
+
+_ITEM_SECTION_TEMPLATE = Template("""        <!-- NEW: Item Analysis Section -->
         <div class="item-analysis-section">
-            <h2 class="section-title"><i class="fas fa-cubes"></i> Item Production Analysis - {current_month_name}</h2>
+            <h2 class="section-title"><i class="fas fa-cubes"></i> Item Production Analysis - $current_month_name</h2>
             
             <div class="item-stats">
                 <div class="item-stat-card">
-                    <div class="item-stat-value" id="totalUniqueItems">{len(item_analysis_data)}</div>
+                    <div class="item-stat-value" id="totalUniqueItems">$unique_items</div>
                     <div class="item-stat-label">Unique Items</div>
                 </div>
                 <div class="item-stat-card">
-                    <div class="item-stat-value" id="totalItemProduction">{sum([item['total_parts'] for item in item_analysis_data]):,}</div>
+                    <div class="item-stat-value" id="totalItemProduction">$total_production</div>
                     <div class="item-stat-label">Total Production</div>
                 </div>
                 <div class="item-stat-card">
-                    <div class="item-stat-value" id="avgItemQuality">{round(sum([item['quality_rate'] for item in item_analysis_data]) / len(item_analysis_data), 1) if item_analysis_data else 0}%</div>
+                    <div class="item-stat-value" id="avgItemQuality">$avg_item_quality%</div>
                     <div class="item-stat-label">Average Quality</div>
                 </div>
                 <div class="item-stat-card">
-                    <div class="item-stat-value" id="topItemProduction">{max([item['total_parts'] for item in item_analysis_data]) if item_analysis_data else 0:,}</div>
+                    <div class="item-stat-value" id="topItemProduction">$top_item_volume</div>
                     <div class="item-stat-label">Top Item Volume</div>
                 </div>
             </div>
@@ -2146,7 +1201,7 @@ def generate_bi_dashboard(reports, config, local_path):
                 </div>
             </div>
             
-            <div class="item-table-container">
+            <div class="item-table-container" id="itemTableContainer">
                 <table class="item-table" id="itemTable">
                     <thead>
                         <tr>
@@ -2162,320 +1217,9 @@ def generate_bi_dashboard(reports, config, local_path):
                             <th>Reports</th>
                         </tr>
                     </thead>
-                    <tbody id="itemTableBody">"""
-
-    # Add item table rows
-    for item in item_analysis_data:
-        quality_class = 'quality-excellent' if item['quality_rate'] >= 95 else 'quality-good' if item['quality_rate'] >= 90 else 'quality-poor'
-        oee_class = 'oee-excellent' if item['avg_oee'] >= 70 else 'oee-good' if item['avg_oee'] >= 45 else 'oee-poor'
-        
-        html += f"""
-                        <tr class="item-row" 
-                            data-item-name="{item['item_name'].lower()}"
-                            data-total-parts="{item['total_parts']}"
-                            data-quality="{item['quality_rate']}"
-                            data-oee="{item['avg_oee']}"
-                            data-machines="{item['machine_count']}"
-                            data-first-date="{item.get('first_date', '')}"
-                            data-last-date="{item.get('last_date', '')}"
-                            data-search="{item['item_name'].lower()}">
-                            <td class="item-name">{item['item_name']}</td>
-                            <td class="item-parts">{item['total_parts']:,}</td>
-                            <td>{item['ok_parts']:,}</td>
-                            <td>{item['nok_parts']:,}</td>
-                            <td class="item-quality {quality_class}">{item['quality_rate']}%</td>
-                            <td class="item-oee {oee_class}">{item['avg_oee']}%</td>
-                            <td>{item['machine_count']}</td>
-                            <td>{item['operator_count']}</td>
-                            <td>{item['order_count']}</td>
-                            <td>{item['report_count']}</td>
-                        </tr>"""
+                    <tbody id="itemTableBody">""")
 
-    html += f"""
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <!-- Interactive Downtime Section -->
-        <div class="downtime-section">
-            <h2 class="section-title"><i class="fas fa-exclamation-triangle"></i> Interactive Downtime Analysis - {current_month_name}</h2>
-            
-            <div class="downtime-controls">
-                <div class="controls-grid">
-                    <div class="control-group">
-                        <label class="control-label">Select Machine</label>
-                        <select class="control-select" id="machineSelect">
-                            <option value="all">All Machines</option>"""
-
-    # Add real machine names from extracted data
-    all_machines = set()
-    for report in current_month_reports:
-        try:
-            if report.get('downtime_machines') and isinstance(report.get('downtime_machines'), dict):
-                for machine_name in report['downtime_machines'].keys():
-                    if isinstance(machine_name, str) and machine_name.strip():
-                        all_machines.add(machine_name.strip())
-            
-            if report.get('machine_data') and isinstance(report.get('machine_data'), list):
-                for machine in report['machine_data']:
-                    if isinstance(machine, dict):
-                        machine_name = machine.get('machine', '')
-                        if isinstance(machine_name, str) and machine_name.strip():
-                            all_machines.add(machine_name.strip())
-            
-            if report.get('top_machines') and isinstance(report.get('top_machines'), list):
-                for machine in report['top_machines']:
-                    if isinstance(machine, dict):
-                        machine_name = machine.get('name', '')
-                        if isinstance(machine_name, str) and machine_name.strip():
-                            all_machines.add(machine_name.strip())
-        except Exception as e:
-            print(f"Error processing machines in report {report.get('date', 'unknown')}: {e}")
-            continue
-
-    # Sort machines for consistent display and show ALL machines
-    sorted_machines = sorted([str(m) for m in all_machines if isinstance(m, str) and m.strip()])
-    for machine in sorted_machines:
-        html += f"""
-                            <option value="{machine}">{machine}</option>"""
-
-    html += f"""
-                        </select>
-                    </div>
-                    <div class="control-group">
-                        <label class="control-label">Downtime Category</label>
-                        <select class="control-select" id="downtimeCategory">
-                            <option value="all">All Categories</option>"""
-
-    # Add real categories from extracted data
-    all_categories = set()
-    for report in current_month_reports:
-        try:
-            if report.get('downtime_categories') and isinstance(report.get('downtime_categories'), dict):
-                for category_name in report['downtime_categories'].keys():
-                    if isinstance(category_name, str) and category_name.strip():
-                        all_categories.add(category_name.strip())
-        except Exception as e:
-            print(f"Error processing categories in report {report.get('date', 'unknown')}: {e}")
-            continue
-
-    # Sort categories for consistent display
-    sorted_categories = sorted([str(c) for c in all_categories if isinstance(c, str) and c.strip()])
-    for category in sorted_categories:
-        html += f"""
-                            <option value="{category}">{category}</option>"""
-
-    html += f"""
-                        </select>
-                    </div>
-                    <div class="control-group">
-                        <label class="control-label">Time Period</label>
-                        <select class="control-select" id="timePeriod">
-                            <option value="week">Last 7 Days</option>
-                            <option value="month" selected>This Month</option>
-                            <option value="quarter">This Quarter</option>
-                        </select>
-                    </div>
-                    <div class="control-group">
-                        <button class="refresh-btn" onclick="updateDowntimeChart()">
-                            <i class="fas fa-sync-alt"></i> Update Analysis
-                        </button>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="downtime-stats">
-                <div class="downtime-stat">
-                    <div class="downtime-stat-value" id="totalDowntime">{current_month_total_downtime:.1f}h</div>
-                    <div class="downtime-stat-label">Total Downtime</div>
-                </div>
-                <div class="downtime-stat">
-                    <div class="downtime-stat-value" id="avgDowntime">{current_month_total_downtime/len(current_month_reports) if current_month_reports else 0:.1f}h</div>
-                    <div class="downtime-stat-label">Average Daily</div>
-                </div>
-                <div class="downtime-stat">
-                    <div class="downtime-stat-value" id="maxDowntime">{max(current_month_downtime_values) if current_month_downtime_values else 0:.1f}h</div>
-                    <div class="downtime-stat-label">Peak Daily</div>
-                </div>
-                <div class="downtime-stat">
-                    <div class="downtime-stat-value" id="downtimeReduction">Analysis</div>
-                    <div class="downtime-stat-label">Data Analysis</div>
-                </div>
-            </div>
-            
-            <div class="downtime-container">
-                <h3 class="chart-title">Machine Downtime Analysis</h3>
-                <div class="chart-wrapper">
-                    <canvas id="downtimeChart"></canvas>
-                </div>
-            </div>
-        </div>
-        
-        <div class="controls">
-            <h3 class="controls-title"><i class="fas fa-filter"></i> Advanced Filtering & Search</h3>
-            
-            <div class="date-filters">
-                <div class="date-selector">
-                    <div class="date-input-group">
-                        <label class="date-label" for="dateFrom">From Date</label>
-                        <input type="date" class="date-picker" id="dateFrom" title="Select start date">
-                    </div>
-                    <div class="date-input-group">
-                        <label class="date-label" for="dateTo">To Date</label>
-                        <input type="date" class="date-picker" id="dateTo" title="Select end date">
-                    </div>
-                </div>
-                
-                <div class="quick-filters">
-                    <button class="quick-filter-btn" onclick="setQuickDateRange('today')">
-                        <i class="fas fa-calendar-day"></i> Today
-                    </button>
-                    <button class="quick-filter-btn" onclick="setQuickDateRange('yesterday')">
-                        <i class="fas fa-history"></i> Yesterday
-                    </button>
-                    <button class="quick-filter-btn" onclick="setQuickDateRange('week')">
-                        <i class="fas fa-calendar-week"></i> This Week
-                    </button>
-                    <button class="quick-filter-btn" onclick="setQuickDateRange('lastweek')">
-                        <i class="fas fa-step-backward"></i> Last Week
-                    </button>
-                    <button class="quick-filter-btn" onclick="setQuickDateRange('month')">
-                        <i class="fas fa-calendar-alt"></i> This Month
-                    </button>
-                    <button class="quick-filter-btn" onclick="setQuickDateRange('lastmonth')">
-                        <i class="fas fa-backward"></i> Last Month
-                    </button>
-                </div>
-                
-                <button class="apply-filters-btn" onclick="filterByDateRange()">
-                    <i class="fas fa-search"></i> Apply Date Filter
-                </button>
-            </div>
-            
-            <div class="advanced-filters">
-                <button class="filter-btn active" onclick="filterReports('all')">
-                    <i class="fas fa-list"></i> All Reports
-                </button>
-                <button class="filter-btn" onclick="filterByOEE('good')">
-                    <i class="fas fa-thumbs-up"></i> Good OEE (≥70%)
-                </button>
-                <button class="filter-btn" onclick="filterByOEE('fair')">
-                    <i class="fas fa-balance-scale"></i> Fair OEE (45-69%)
-                </button>
-                <button class="filter-btn" onclick="filterByOEE('poor')">
-                    <i class="fas fa-exclamation-triangle"></i> Poor OEE (<45%)
-                </button>
-                <button class="filter-btn" onclick="filterByQuality('high')">
-                    <i class="fas fa-star"></i> High Quality (≥95%)
-                </button>
-            </div>
-            
-            <input type="text" class="search-box" id="searchInput" 
-                   placeholder="🔍 Search by date, OEE percentage, production metrics, or filename...">
-        </div>
-        
-        <div class="reports-container" id="reportsContainer">"""
-    
-    # Generate report cards with real data
-    for folder_name, folder_reports in folders.items():
-        html += f"""
-        <div class="folder-section" data-folder="{folder_name}">
-            <div class="folder-header">
-                <div class="folder-title">
-                    <i class="fas fa-folder-open"></i>
-                    {folder_name} ({len(folder_reports)} reports)
-                </div>
-            </div>
-            <div class="reports-grid">"""
-        
-        # Add reports for this folder
-        for report in folder_reports:
-            date = report['date']
-            title = report['title']
-            filename = report['filename']
-            sharepoint_url = report['sharepoint_url']
-            
-            # Enhanced data
-            main_oee = report['main_oee']
-            total_parts = report['total_parts']
-            ok_parts = report['ok_parts']
-            quality_rate = report['quality_rate']
-            downtime_hours = report['downtime_hours']
-            status = report['status']
-            
-            try:
-                date_obj = datetime.strptime(date, '%Y-%m-%d')
-                day_name = date_obj.strftime('%A')
-                formatted_date = date_obj.strftime('%B %d, %Y')
-            except:
-                day_name = ""
-                formatted_date = date
-            
-            # Status styling
-            status_class = f"status-{status.lower()}"
-            
-            # Format values for display
-            oee_display = f"{main_oee:.1f}" if main_oee is not None else "N/A"
-            parts_display = f"{total_parts:,}" if total_parts is not None else "N/A"
-            ok_display = f"{ok_parts:,}" if ok_parts is not None else "N/A"
-            quality_display = f"{quality_rate:.1f}" if quality_rate is not None else "N/A"
-            downtime_display = f"{downtime_hours:.1f}" if downtime_hours is not None else "N/A"
-            
-            html += f"""
-                <div class="report-card" 
-                     data-date="{date}" 
-                     data-oee="{main_oee if main_oee is not None else 0}"
-                     data-quality="{quality_rate if quality_rate is not None else 0}"
-                     data-search="{date} {title} {filename} {day_name} {status} {oee_display} {parts_display}">
-                    
-                    <div class="report-header">
-                        <div class="report-status {status_class}">{status.upper()}</div>
-                        <div class="report-date">{date}</div>
-                        <div class="report-day">{day_name}</div>
-                    </div>
-                    
-                    <div class="report-body">
-                        <div class="report-title">{title}</div>
-                        
-                        <div class="main-oee">
-                            <div class="main-oee-value">{oee_display}{'%' if main_oee is not None else ''}</div>
-                            <div class="main-oee-label">OEE Performance</div>
-                        </div>
-                        
-                        <div class="metrics-grid">
-                            <div class="metric-item">
-                                <div class="metric-value">{parts_display}</div>
-                                <div class="metric-label">Total Parts</div>
-                            </div>
-                            <div class="metric-item">
-                                <div class="metric-value">{ok_display}</div>
-                                <div class="metric-label">OK Parts</div>
-                            </div>
-                            <div class="metric-item">
-                                <div class="metric-value">{quality_display}{'%' if quality_rate is not None else ''}</div>
-                                <div class="metric-label">Quality Rate</div>
-                            </div>
-                            <div class="metric-item">
-                                <div class="metric-value">{downtime_display}{'h' if downtime_hours is not None else ''}</div>
-                                <div class="metric-label">Downtime</div>
-                            </div>
-                        </div>
-                        
-                        <div class="report-actions">
-                            <a href="{sharepoint_url}" class="report-link" target="_blank">
-                                <i class="fab fa-microsoft"></i> Open Report <i class="fas fa-external-link-alt"></i>
-                            </a>
-                        </div>
-                    </div>
-                </div>"""
-        
-        html += """
-            </div>
-        </div>"""
-    
-    # Complete the HTML with JavaScript
-    html += f"""
+_SCRIPT_TEMPLATE = Template("""
         </div>
         
         <div id="noResults" class="no-results">
@@ -2487,21 +1231,50 @@ def generate_bi_dashboard(reports, config, local_path):
     
     <script>
         // Data for charts
-        const monthlyOeeData = {monthly_oee_json};
-        const monthlyPartsData = {monthly_parts_json};
-        const downtimeBreakdownData = {downtime_breakdown_json};
-        const machineDowntimeData = {machine_downtime_json};
-        const currentMonthReports = {current_month_reports_json};
-        const categoryBreakdownData = {category_breakdown_json};
-        const itemAnalysisData = {item_analysis_json};
+        const monthlyOeeData = $monthly_oee_json;
+        const monthlyPartsData = $monthly_parts_json;
+        const downtimeBreakdownData = $downtime_breakdown_json;
+        const machineDowntimeData = $machine_downtime_json;
+        const currentMonthReports = $current_month_reports_json;
+        const categoryBreakdownData = $category_breakdown_json;
+        const machineOeeData = $machine_oee_json;
+        const itemAnalysisData = $item_analysis_json;
+        
+        // Sample data shown by the machine and operator charts when there is nothing to plot
+        const SAMPLE_MACHINES = Object.freeze([
+            { name: '306 - Kellenberger 100', oee: 86.0 },
+            { name: '203 - V1000', oee: 85.8 },
+            { name: '103 - GS 200', oee: 82.4 },
+            { name: '207 - DMG HSC 55', oee: 67.9 },
+            { name: '208 - YASDA PX30i', oee: 52.5 },
+            { name: '201 - VM740S Neway', oee: 43.3 },
+            { name: '204 - Hec 400', oee: 29.3 },
+            { name: '106 - BNE 51MYY', oee: 27.2 }
+        ]);
+        const SAMPLE_OPERATORS = Object.freeze([
+            { name: 'POPA Andrei', shortLabel: 'POPA A.', oee: 100.0 },
+            { name: 'IUDIAN MIHAI', shortLabel: 'IUDIAN M.', oee: 99.0 },
+            { name: 'SUMAHAR Liviu', shortLabel: 'SUMAHAR L.', oee: 83.3 },
+            { name: 'TODOSI Robert', shortLabel: 'TODOSI R.', oee: 57.8 },
+            { name: 'RATAN Dan', shortLabel: 'RATAN D.', oee: 50.0 },
+            { name: 'ILIE Constantin', shortLabel: 'ILIE C.', oee: 43.3 },
+            { name: 'KANAKALA Charan', shortLabel: 'KANAKALA C.', oee: 28.8 },
+            { name: 'MIHUT Dragos', shortLabel: 'MIHUT D.', oee: 26.6 }
+        ]);
         
         // Chart.js configuration
         Chart.defaults.font.family = "'Segoe UI', Tahoma, Geneva, Verdana, sans-serif";
         Chart.defaults.font.size = 12;
         Chart.defaults.color = '#2c3e50';
         
+        // No tweening: every chart draws and redraws in a single frame
+        Chart.defaults.animation = false;
+        
+        // Cap the backing store at 2x so high-DPI screens don't allocate oversized canvases
+        Chart.defaults.devicePixelRatio = Math.min(window.devicePixelRatio || 1, 2);
+        
         // Red-themed chart colors
-        const chartColors = {{
+        const chartColors = {
             primary: '#dc2626',
             success: '#27ae60',
             warning: '#f39c12',
@@ -2518,10 +1291,68 @@ def generate_bi_dashboard(reports, config, local_path):
                 '#1abc9c',  // Turquoise
                 '#34495e'   // Dark Gray
             ]
-        }};
+        };
+        
+        // Option pieces shared by every chart instead of rebuilt in each literal
+        const tooltipStyle = {
+            backgroundColor: 'rgba(44, 62, 80, 0.9)',
+            titleColor: '#ffffff',
+            bodyColor: '#ffffff',
+            borderColor: chartColors.primary,
+            borderWidth: 1,
+            cornerRadius: 6,
+            padding: 12
+        };
+        const gridLines = { color: 'rgba(149, 165, 166, 0.2)' };
+        const percentTick = value => value + '%';
+        const hoursTick = value => value + 'h';
+        
+        // Chart tiers: OEE 0 = below 45%, 1 = below 70%, 2 = on target; downtime 0 = up to 1h ... 3 = over 6h
+        function oeeTier(oee) {
+            return (oee >= 45) + (oee >= 70);
+        }
+        
+        function downtimeTier(hours) {
+            return (hours > 1) + (hours > 3) + (hours > 6);
+        }
+        
+        const oeeTierColors = [chartColors.danger, chartColors.warning, chartColors.success];
+        const downtimeTierColors = [chartColors.success, chartColors.secondary, chartColors.warning, chartColors.danger];
+        
+        // Tooltip callouts per tier, shared by every bar instead of rebuilt on each hover
+        const machineCallouts = [
+            ['🔴 Critical performance', '🚨 Immediate attention needed', '🔧 Maintenance/training required'],
+            ['🟡 Needs improvement', '⚠️ Below target', '📈 Consider optimization'],
+            ['🟢 Excellent performance', '✅ Above target (70%)', '🏆 Top performer']
+        ];
+        
+        const operatorCallouts = [
+            ['🔴 Needs training/support', '📚 Consider additional guidance', '🤝 Mentorship recommended'],
+            ['🟡 Good performance', '📈 Room for improvement', '📚 Additional training opportunities'],
+            ['🟢 Top performer', '🏆 Excellent OEE results', '⭐ Model operator']
+        ];
+        
+        const monthlyOeeCallouts = ['🔴 Critical attention needed', '⚠️ Room for improvement', '📈 Excellent Performance!'];
+        
+        const downtimeCallouts = [
+            ['🟢 Low downtime - good performance', '✅ Within acceptable limits'],
+            ['🟠 Moderate downtime', '📋 Review for optimization opportunities'],
+            ['🟡 High downtime - needs attention', '⚠️ Consider preventive measures', '📈 Monitor trends closely'],
+            ['🔴 Critical downtime level', '🚨 Immediate investigation required', '📊 Significantly impacts production']
+        ];
+        
+        // Live chart per canvas id; rebuilding a chart destroys the instance it replaces
+        const chartInstances = {};
+        
+        function mountChart(canvasId, config) {
+            if (chartInstances[canvasId]) chartInstances[canvasId].destroy();
+            const chart = new Chart(document.getElementById(canvasId).getContext('2d'), config);
+            chartInstances[canvasId] = chart;
+            return chart;
+        }
         
         // Initialize charts
-        function initializeCharts() {{
+        function initializeCharts() {
             createMonthlyOeeChart();
             createPartsChart();
             createMachineChart();
@@ -2529,16 +1360,14 @@ def generate_bi_dashboard(reports, config, local_path):
             createCategoryChart();
             createDowntimeChart();
             console.log('All charts initialized successfully');
-        }}
+        }
         
-        function createMonthlyOeeChart() {{
-            const ctx = document.getElementById('monthlyOeeChart').getContext('2d');
-            
-            new Chart(ctx, {{
+        function createMonthlyOeeChart() {
+            mountChart('monthlyOeeChart', {
                 type: 'line',
-                data: {{
+                data: {
                     labels: monthlyOeeData.labels,
-                    datasets: [{{
+                    datasets: [{
                         label: 'Daily OEE (%)',
                         data: monthlyOeeData.values,
                         borderColor: chartColors.primary,
@@ -2551,7 +1380,7 @@ def generate_bi_dashboard(reports, config, local_path):
                         tension: 0.4,
                         fill: true,
                         borderWidth: 3
-                    }}, {{
+                    }, {
                         label: 'Target (70%)',
                         data: monthlyOeeData.labels.map(() => 70),
                         borderColor: chartColors.success,
@@ -2559,702 +1388,612 @@ def generate_bi_dashboard(reports, config, local_path):
                         borderDash: [8, 4],
                         pointRadius: 0,
                         borderWidth: 2
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
+                    plugins: {
+                        legend: {
                             display: true,
                             position: 'top',
-                            labels: {{
+                            labels: {
                                 padding: 15,
                                 usePointStyle: true
-                            }}
-                        }},
-                        tooltip: {{
-                            backgroundColor: 'rgba(44, 62, 80, 0.9)',
-                            titleColor: '#ffffff',
-                            bodyColor: '#ffffff',
-                            borderColor: chartColors.primary,
-                            borderWidth: 1,
-                            cornerRadius: 6,
-                            padding: 12,
-                            callbacks: {{
-                                afterBody: function(context) {{
+                            }
+                        },
+                        tooltip: {
+                            ...tooltipStyle,
+                            callbacks: {
+                                afterBody: function(context) {
                                     const index = context[0].dataIndex;
                                     const value = context[0].raw;
                                     const machineDetails = monthlyOeeData.machine_details[index];
                                     
-                                    let callouts = [];
-                                    if (value >= 70) callouts.push('📈 Excellent Performance!');
-                                    else if (value >= 45) callouts.push('⚠️ Room for improvement');
-                                    else callouts.push('🔴 Critical attention needed');
+                                    const callouts = [monthlyOeeCallouts[oeeTier(value)]];
                                     
-                                    if (machineDetails) {{
+                                    if (machineDetails) {
                                         callouts.push('🏭 Active Machines: ' + machineDetails.machine_count);
-                                        if (machineDetails.top_machine !== 'N/A') {{
+                                        if (machineDetails.top_machine !== 'N/A') {
                                             callouts.push('🥇 Top Performer: ' + machineDetails.top_machine + ' (' + machineDetails.top_machine_oee + '%)');
-                                        }}
-                                    }}
+                                        }
+                                    }
                                     
                                     return callouts;
-                                }}
-                            }}
-                        }}
-                    }},
-                    scales: {{
-                        x: {{
-                            grid: {{
-                                color: 'rgba(149, 165, 166, 0.2)'
-                            }}
-                        }},
-                        y: {{
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        x: {
+                            grid: gridLines
+                        },
+                        y: {
                             beginAtZero: true,
                             max: 100,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return value + '%';
-                                }}
-                            }},
-                            grid: {{
-                                color: 'rgba(149, 165, 166, 0.2)'
-                            }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
-        
-        function createPartsChart() {{
-            const ctx = document.getElementById('partsChart').getContext('2d');
-            
+                            ticks: {
+                                callback: percentTick
+                            },
+                            grid: gridLines
+                        }
+                    }
+                }
+            });
+        }
+        
+        function createPartsChart() {
             const total = monthlyPartsData.ok_parts + monthlyPartsData.nok_parts;
             const qualityRate = total > 0 ? (monthlyPartsData.ok_parts / total * 100).toFixed(1) : 0;
-            
-            new Chart(ctx, {{
+            const defectRate = (100 - qualityRate).toFixed(1);
+            
+            // Tooltip callouts for the OK and NOK slices
+            const partsCallouts = [
+                [
+                    'Quality Rate: ' + qualityRate + '%',
+                    qualityRate >= 95 ? '🟢 Excellent quality!' : qualityRate >= 90 ? '🟡 Good quality' : '🔴 Quality needs attention'
+                ],
+                [
+                    'Defect Rate: ' + defectRate + '%',
+                    defectRate < 5 ? '🟢 Low defect rate' : defectRate < 10 ? '🟡 Moderate defects' : '🔴 High defect rate - investigate'
+                ]
+            ];
+            
+            mountChart('partsChart', {
                 type: 'doughnut',
-                data: {{
+                data: {
                     labels: ['OK Parts', 'NOK Parts'],
-                    datasets: [{{
+                    datasets: [{
                         data: [monthlyPartsData.ok_parts, monthlyPartsData.nok_parts],
                         backgroundColor: [chartColors.success, chartColors.danger],
                         borderColor: [chartColors.success, chartColors.danger],
                         borderWidth: 3,
                         hoverOffset: 8
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
+                    plugins: {
+                        legend: {
                             position: 'bottom',
-                            labels: {{
+                            labels: {
                                 padding: 20,
                                 usePointStyle: true,
-                                font: {{
+                                font: {
                                     size: 13,
                                     weight: '600'
-                                }}
-                            }}
-                        }},
-                        tooltip: {{
-                            backgroundColor: 'rgba(44, 62, 80, 0.9)',
-                            titleColor: '#ffffff',
-                            bodyColor: '#ffffff',
-                            borderColor: chartColors.primary,
-                            borderWidth: 1,
-                            cornerRadius: 6,
-                            padding: 12,
-                            callbacks: {{
-                                label: function(context) {{
+                                }
+                            }
+                        },
+                        tooltip: {
+                            ...tooltipStyle,
+                            callbacks: {
+                                label: function(context) {
                                     const value = context.raw.toLocaleString();
                                     const percentage = ((context.raw / total) * 100).toFixed(1);
                                     return context.label + ': ' + value + ' (' + percentage + '%)';
-                                }},
-                                afterLabel: function(context) {{
-                                    const value = context.raw;
-                                    const index = context.dataIndex;
-                                    let callouts = [];
-                                    
-                                    // Quality assessment
-                                    if (index === 0) {{ // OK Parts
-                                        callouts.push('Quality Rate: ' + qualityRate + '%');
-                                        if (qualityRate >= 95) callouts.push('🟢 Excellent quality!');
-                                        else if (qualityRate >= 90) callouts.push('🟡 Good quality');
-                                        else callouts.push('🔴 Quality needs attention');
-                                    }} else {{ // NOK Parts
-                                        const defectRate = (100 - qualityRate).toFixed(1);
-                                        callouts.push('Defect Rate: ' + defectRate + '%');
-                                        if (defectRate < 5) callouts.push('🟢 Low defect rate');
-                                        else if (defectRate < 10) callouts.push('🟡 Moderate defects');
-                                        else callouts.push('🔴 High defect rate - investigate');
-                                    }}
-                                    
-                                    return callouts;
-                                }}
-                            }}
-                        }}
-                    }},
+                                },
+                                afterLabel: function(context) {
+                                    return partsCallouts[context.dataIndex];
+                                }
+                            }
+                        }
+                    },
                     cutout: '50%'
-                }}
-            }});
-        }}
+                }
+            });
+        }
         
-        function createMachineChart() {{
-            const ctx = document.getElementById('machineChart').getContext('2d');
-            
-            // Extract top machines from the current month data
-            let machineData = [];
-            
-            // Aggregate machine data from all reports
-            const machineOeeMap = new Map();
-            const machineCountMap = new Map();
-            
-            currentMonthReports.forEach(report => {{
-                if (report.top_machines) {{
-                    report.top_machines.forEach(machine => {{
-                        const name = machine.name;
-                        const oee = machine.oee;
-                        
-                        if (!machineOeeMap.has(name)) {{
-                            machineOeeMap.set(name, 0);
-                            machineCountMap.set(name, 0);
-                        }}
-                        
-                        machineOeeMap.set(name, machineOeeMap.get(name) + oee);
-                        machineCountMap.set(name, machineCountMap.get(name) + 1);
-                    }});
-                }}
-            }});
-            
-            // Calculate average OEE for each machine
-            machineOeeMap.forEach((totalOee, machineName) => {{
-                const count = machineCountMap.get(machineName);
-                const avgOee = totalOee / count;
-                machineData.push({{ name: machineName, oee: avgOee }});
-            }});
-            
-            // Sort by OEE and show ALL machines (not just top 10)
-            machineData.sort((a, b) => b.oee - a.oee);
-            
-            // If no data, use sample data
-            if (machineData.length === 0) {{
-                machineData = [
-                    {{ name: '306 - Kellenberger 100', oee: 86.0 }},
-                    {{ name: '203 - V1000', oee: 85.8 }},
-                    {{ name: '103 - GS 200', oee: 82.4 }},
-                    {{ name: '207 - DMG HSC 55', oee: 67.9 }},
-                    {{ name: '208 - YASDA PX30i', oee: 52.5 }},
-                    {{ name: '201 - VM740S Neway', oee: 43.3 }},
-                    {{ name: '204 - Hec 400', oee: 29.3 }},
-                    {{ name: '106 - BNE 51MYY', oee: 27.2 }}
-                ];
-            }}
+        function createMachineChart() {
+            // Average OEE per machine, aggregated and sorted in Python - show ALL machines
+            const machineData = machineOeeData.length ? machineOeeData : SAMPLE_MACHINES;
             
             console.log('Machine data for chart:', machineData.length, 'machines');
             
-            new Chart(ctx, {{
+            // Labels, values, tiers and colours in one pass over the sorted machines
+            const machineCount = machineData.length;
+            const machineLabels = new Array(machineCount);
+            const machineValues = new Array(machineCount);
+            const machineTiers = new Array(machineCount);
+            const machineColors = new Array(machineCount);
+            for (let i = 0; i < machineCount; i++) {
+                const m = machineData[i];
+                machineLabels[i] = m.name.length > 15 ? m.name.substring(0, 15) + '...' : m.name;
+                machineValues[i] = m.oee;
+                machineTiers[i] = oeeTier(m.oee);
+                machineColors[i] = oeeTierColors[machineTiers[i]];
+            }
+            
+            mountChart('machineChart', {
                 type: 'bar',
-                data: {{
-                    labels: machineData.map(m => m.name.length > 15 ? m.name.substring(0, 15) + '...' : m.name),
-                    datasets: [{{
+                data: {
+                    labels: machineLabels,
+                    datasets: [{
                         label: 'OEE Performance (%)',
-                        data: machineData.map(m => m.oee),
-                        backgroundColor: machineData.map(m => {{
-                            if (m.oee >= 70) return chartColors.success;
-                            if (m.oee >= 45) return chartColors.warning;
-                            return chartColors.danger;
-                        }}),
+                        data: machineValues,
+                        backgroundColor: machineColors,
                         borderWidth: 0,
                         borderRadius: 4,
                         borderSkipped: false
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    // One value per label, so Chart.js can skip its index bookkeeping
+                    normalized: true,
                     indexAxis: 'y',
-                    plugins: {{
-                        legend: {{ display: false }},
-                        tooltip: {{
-                            backgroundColor: 'rgba(44, 62, 80, 0.9)',
-                            titleColor: '#ffffff',
-                            bodyColor: '#ffffff',
-                            borderColor: chartColors.primary,
-                            borderWidth: 1,
-                            cornerRadius: 6,
-                            padding: 12,
-                            callbacks: {{
-                                title: function(context) {{
+                    plugins: {
+                        legend: { display: false },
+                        tooltip: {
+                            ...tooltipStyle,
+                            callbacks: {
+                                title: function(context) {
                                     return machineData[context[0].dataIndex].name;
-                                }},
-                                afterLabel: function(context) {{
-                                    const oee = context.raw;
-                                    const callouts = [];
-                                    
-                                    if (oee >= 70) {{
-                                        callouts.push('🟢 Excellent performance');
-                                        callouts.push('✅ Above target (70%)');
-                                        callouts.push('🏆 Top performer');
-                                    }} else if (oee >= 45) {{
-                                        callouts.push('🟡 Needs improvement');
-                                        callouts.push('⚠️ Below target');
-                                        callouts.push('📈 Consider optimization');
-                                    }} else {{
-                                        callouts.push('🔴 Critical performance');
-                                        callouts.push('🚨 Immediate attention needed');
-                                        callouts.push('🔧 Maintenance/training required');
-                                    }}
-                                    
-                                    return callouts;
-                                }}
-                            }}
-                        }}
-                    }},
-                    scales: {{
-                        x: {{
+                                },
+                                afterLabel: function(context) {
+                                    return machineCallouts[machineTiers[context.dataIndex]];
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        x: {
                             beginAtZero: true,
                             max: 100,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return value + '%';
-                                }},
-                                font: {{ weight: '500' }}
-                            }},
-                            grid: {{ color: 'rgba(149, 165, 166, 0.2)' }}
-                        }},
-                        y: {{
-                            ticks: {{
-                                font: {{ weight: '500', size: 10 }}
-                            }},
-                            grid: {{ color: 'rgba(149, 165, 166, 0.2)' }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
-        
-        function createOperatorChart() {{
-            const ctx = document.getElementById('operatorChart').getContext('2d');
-            
-            // Extract top operators from the current month data with case-insensitive merging
-            let operatorData = [];
-            
-            // Aggregate operator data from all reports with case-insensitive name matching
-            const operatorOeeMap = new Map();
-            const operatorCountMap = new Map();
-            
-            currentMonthReports.forEach(report => {{
-                if (report.top_operators) {{
-                    report.top_operators.forEach(operator => {{
-                        const rawName = operator.name;
-                        const oee = operator.oee;
-                        
-                        // Normalize name to handle case variations
-                        const normalizedName = rawName.toLowerCase().trim();
-                        
-                        // Find existing operator with same normalized name
-                        let existingKey = null;
-                        for (let [key] of operatorOeeMap) {{
-                            if (key.toLowerCase().trim() === normalizedName) {{
-                                existingKey = key;
-                                break;
-                            }}
-                        }}
-                        
-                        const finalName = existingKey || rawName; // Use existing name format or new one
-                        
-                        if (!operatorOeeMap.has(finalName)) {{
-                            operatorOeeMap.set(finalName, 0);
-                            operatorCountMap.set(finalName, 0);
-                        }}
-                        
-                        operatorOeeMap.set(finalName, operatorOeeMap.get(finalName) + oee);
-                        operatorCountMap.set(finalName, operatorCountMap.get(finalName) + 1);
-                    }});
-                }}
-            }});
-            
-            // Calculate average OEE for each operator
-            operatorOeeMap.forEach((totalOee, operatorName) => {{
-                const count = operatorCountMap.get(operatorName);
-                const avgOee = totalOee / count;
-                operatorData.push({{ name: operatorName, oee: avgOee }});
-            }});
-            
-            // Sort by OEE and show ALL operators (not just top 10)
-            operatorData.sort((a, b) => b.oee - a.oee);
-            
-            // If no data, use sample data
-            if (operatorData.length === 0) {{
-                operatorData = [
-                    {{ name: 'POPA Andrei', oee: 100.0 }},
-                    {{ name: 'IUDIAN MIHAI', oee: 99.0 }},
-                    {{ name: 'SUMAHAR Liviu', oee: 83.3 }},
-                    {{ name: 'TODOSI Robert', oee: 57.8 }},
-                    {{ name: 'RATAN Dan', oee: 50.0 }},
-                    {{ name: 'ILIE Constantin', oee: 43.3 }},
-                    {{ name: 'KANAKALA Charan', oee: 28.8 }},
-                    {{ name: 'MIHUT Dragos', oee: 26.6 }}
-                ];
-            }}
+                            ticks: {
+                                callback: percentTick,
+                                font: { weight: '500' }
+                            },
+                            grid: gridLines
+                        },
+                        y: {
+                            ticks: {
+                                font: { weight: '500', size: 10 }
+                            },
+                            grid: gridLines
+                        }
+                    }
+                }
+            });
+        }
+        
+        // "SURNAME First" -> "SURNAME F.", read off the first space without splitting the name
+        function operatorShortLabel(name) {
+            const space = name.indexOf(' ');
+            if (space < 0) return name;
+            const initial = name.charAt(space + 1);
+            return name.slice(0, space) + ' ' + (initial === ' ' ? '' : initial) + '.';
+        }
+        
+        function createOperatorChart() {
+            // Extract top operators from the current month data with case-insensitive merging;
+            // with no reports the sample data is used without building the aggregation map
+            let operatorData = SAMPLE_OPERATORS;
+            
+            if (currentMonthReports.length) {
+                // Aggregate operator data from all reports, keyed by the normalized name
+                // so case variations merge under the first spelling seen
+                const operatorOeeMap = new Map();
+                
+                currentMonthReports.forEach(report => {
+                    if (report.top_operators) {
+                        report.top_operators.forEach(operator => {
+                            const key = operator.name.toLowerCase().trim();
+                            let entry = operatorOeeMap.get(key);
+                            if (!entry) {
+                                entry = {
+                                    displayName: operator.name,
+                                    shortLabel: operatorShortLabel(operator.name),
+                                    totalOee: 0,
+                                    count: 0
+                                };
+                                operatorOeeMap.set(key, entry);
+                            }
+                            entry.totalOee += operator.oee;
+                            entry.count++;
+                        });
+                    }
+                });
+                
+                // Calculate average OEE for each operator, keeping the sample data if none were found
+                if (operatorOeeMap.size) {
+                    operatorData = [];
+                    for (const entry of operatorOeeMap.values()) {
+                        operatorData.push({
+                            name: entry.displayName,
+                            shortLabel: entry.shortLabel,
+                            oee: entry.totalOee / entry.count
+                        });
+                    }
+                    
+                    // Sort by OEE and show ALL operators (not just top 10)
+                    operatorData.sort((a, b) => b.oee - a.oee);
+                }
+            }
             
             console.log('Operator data for chart:', operatorData.length, 'operators');
             
-            new Chart(ctx, {{
+            // Labels, values, tiers and colours in one pass over the sorted operators
+            const operatorCount = operatorData.length;
+            const operatorLabels = new Array(operatorCount);
+            const operatorValues = new Array(operatorCount);
+            const operatorTiers = new Array(operatorCount);
+            const operatorColors = new Array(operatorCount);
+            for (let i = 0; i < operatorCount; i++) {
+                const o = operatorData[i];
+                operatorLabels[i] = o.shortLabel;
+                operatorValues[i] = o.oee;
+                operatorTiers[i] = oeeTier(o.oee);
+                operatorColors[i] = oeeTierColors[operatorTiers[i]];
+            }
+            
+            mountChart('operatorChart', {
                 type: 'bar',
-                data: {{
-                    labels: operatorData.map(o => {{
-                        const parts = o.name.split(' ');
-                        return parts.length > 1 ? parts[0] + ' ' + parts[1].charAt(0) + '.' : parts[0];
-                    }}),
-                    datasets: [{{
+                data: {
+                    labels: operatorLabels,
+                    datasets: [{
                         label: 'Average OEE Performance (%)',
-                        data: operatorData.map(o => o.oee),
-                        backgroundColor: operatorData.map(o => {{
-                            if (o.oee >= 70) return chartColors.success;
-                            if (o.oee >= 45) return chartColors.warning;
-                            return chartColors.danger;
-                        }}),
+                        data: operatorValues,
+                        backgroundColor: operatorColors,
                         borderWidth: 0,
                         borderRadius: 4,
                         borderSkipped: false
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
+                    // One value per label, so Chart.js can skip its index bookkeeping
+                    normalized: true,
                     indexAxis: 'y',
-                    plugins: {{
-                        legend: {{ display: false }},
-                        tooltip: {{
-                            backgroundColor: 'rgba(44, 62, 80, 0.9)',
-                            titleColor: '#ffffff',
-                            bodyColor: '#ffffff',
-                            borderColor: chartColors.primary,
-                            borderWidth: 1,
-                            cornerRadius: 6,
-                            padding: 12,
-                            callbacks: {{
-                                title: function(context) {{
+                    plugins: {
+                        legend: { display: false },
+                        tooltip: {
+                            ...tooltipStyle,
+                            callbacks: {
+                                title: function(context) {
                                     return operatorData[context[0].dataIndex].name;
-                                }},
-                                afterLabel: function(context) {{
-                                    const oee = context.raw;
-                                    const callouts = [];
-                                    
-                                    if (oee >= 70) {{
-                                        callouts.push('🟢 Top performer');
-                                        callouts.push('🏆 Excellent OEE results');
-                                        callouts.push('⭐ Model operator');
-                                    }} else if (oee >= 45) {{
-                                        callouts.push('🟡 Good performance');
-                                        callouts.push('📈 Room for improvement');
-                                        callouts.push('📚 Additional training opportunities');
-                                    }} else {{
-                                        callouts.push('🔴 Needs training/support');
-                                        callouts.push('📚 Consider additional guidance');
-                                        callouts.push('🤝 Mentorship recommended');
-                                    }}
-                                    
-                                    return callouts;
-                                }}
-                            }}
-                        }}
-                    }},
-                    scales: {{
-                        x: {{
+                                },
+                                afterLabel: function(context) {
+                                    return operatorCallouts[operatorTiers[context.dataIndex]];
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        x: {
                             beginAtZero: true,
                             max: 100,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return value + '%';
-                                }},
-                                font: {{ weight: '500' }}
-                            }},
-                            grid: {{ color: 'rgba(149, 165, 166, 0.2)' }}
-                        }},
-                        y: {{
-                            ticks: {{
-                                font: {{ weight: '500', size: 10 }}
-                            }},
-                            grid: {{ color: 'rgba(149, 165, 166, 0.2)' }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
-        
-        function createCategoryChart() {{
-            const ctx = document.getElementById('categoryChart').getContext('2d');
-            
+                            ticks: {
+                                callback: percentTick,
+                                font: { weight: '500' }
+                            },
+                            grid: gridLines
+                        },
+                        y: {
+                            ticks: {
+                                font: { weight: '500', size: 10 }
+                            },
+                            grid: gridLines
+                        }
+                    }
+                }
+            });
+        }
+        
+        function createCategoryChart() {
             const categories = Object.keys(categoryBreakdownData);
             const values = Object.values(categoryBreakdownData);
             
-            new Chart(ctx, {{
+            // Slice labels with their share of the total, formatted once
+            const valuesTotal = values.reduce((a, b) => a + b, 0);
+            const sliceLabels = categories.map((label, index) =>
+                label + ': ' + values[index].toFixed(1) + 'h (' + ((values[index] / valuesTotal) * 100).toFixed(1) + '%)'
+            );
+            
+            // Category-specific insights, one list per slice
+            const categoryCallouts = categories.map((label, index) => {
+                const category = label.toLowerCase();
+                const hours = values[index];
+                const callouts = [];
+                
+                if (category.includes('setup') || category.includes('changeover')) {
+                    if (hours > 3) callouts.push('🔴 Excessive setup time');
+                    else if (hours > 1.5) callouts.push('🟡 Moderate setup time');
+                    else callouts.push('🟢 Efficient setup');
+                    callouts.push('💡 Consider SMED techniques');
+                } else if (category.includes('maintenance')) {
+                    if (hours > 2) callouts.push('🔧 High maintenance needs');
+                    else callouts.push('🔧 Regular maintenance');
+                    callouts.push('📅 Check preventive schedule');
+                } else if (category.includes('quality') || category.includes('defect')) {
+                    if (hours > 1) callouts.push('🔍 Quality issues detected');
+                    callouts.push('📊 Review process control');
+                } else if (category.includes('material') || category.includes('wait')) {
+                    if (hours > 2) callouts.push('📦 Material flow issues');
+                    callouts.push('🚛 Check supply chain');
+                }
+                
+                return callouts;
+            });
+            
+            mountChart('categoryChart', {
                 type: 'pie',
-                data: {{
+                data: {
                     labels: categories,
-                    datasets: [{{
+                    datasets: [{
                         data: values,
                         backgroundColor: chartColors.categoryColors.slice(0, categories.length),
                         borderColor: '#ffffff',
                         borderWidth: 2,
                         hoverOffset: 6
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
+                    plugins: {
+                        legend: {
                             position: 'bottom',
-                            labels: {{
+                            labels: {
                                 padding: 15,
                                 usePointStyle: true,
-                                font: {{
+                                font: {
                                     size: 11,
                                     weight: '500'
-                                }}
-                            }}
-                        }},
-                        tooltip: {{
-                            backgroundColor: 'rgba(44, 62, 80, 0.9)',
-                            titleColor: '#ffffff',
-                            bodyColor: '#ffffff',
-                            borderColor: chartColors.primary,
-                            borderWidth: 1,
-                            cornerRadius: 6,
-                            padding: 12,
-                            callbacks: {{
-                                label: function(context) {{
-                                    const value = context.raw.toFixed(1);
-                                    const total = values.reduce((a, b) => a + b, 0);
-                                    const percentage = ((context.raw / total) * 100).toFixed(1);
-                                    return context.label + ': ' + value + 'h (' + percentage + '%)';
-                                }},
-                                afterLabel: function(context) {{
-                                    const category = context.label.toLowerCase();
-                                    const hours = context.raw;
-                                    const callouts = [];
-                                    
-                                    // Category-specific insights
-                                    if (category.includes('setup') || category.includes('changeover')) {{
-                                        if (hours > 3) callouts.push('🔴 Excessive setup time');
-                                        else if (hours > 1.5) callouts.push('🟡 Moderate setup time');
-                                        else callouts.push('🟢 Efficient setup');
-                                        callouts.push('💡 Consider SMED techniques');
-                                    }} else if (category.includes('maintenance')) {{
-                                        if (hours > 2) callouts.push('🔧 High maintenance needs');
-                                        else callouts.push('🔧 Regular maintenance');
-                                        callouts.push('📅 Check preventive schedule');
-                                    }} else if (category.includes('quality') || category.includes('defect')) {{
-                                        if (hours > 1) callouts.push('🔍 Quality issues detected');
-                                        callouts.push('📊 Review process control');
-                                    }} else if (category.includes('material') || category.includes('wait')) {{
-                                        if (hours > 2) callouts.push('📦 Material flow issues');
-                                        callouts.push('🚛 Check supply chain');
-                                    }}
-                                    
-                                    return callouts;
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
+                                }
+                            }
+                        },
+                        tooltip: {
+                            ...tooltipStyle,
+                            callbacks: {
+                                label: function(context) {
+                                    return sliceLabels[context.dataIndex];
+                                },
+                                afterLabel: function(context) {
+                                    return categoryCallouts[context.dataIndex];
+                                }
+                            }
+                        }
+                    }
+                }
+            });
+        }
         
         let downtimeChart;
         
-        function createDowntimeChart() {{
-            const ctx = document.getElementById('downtimeChart').getContext('2d');
-            
+        function createDowntimeChart() {
             console.log('Creating downtime chart with data:', downtimeBreakdownData);
             
-            downtimeChart = new Chart(ctx, {{
+            downtimeChart = mountChart('downtimeChart', {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: downtimeBreakdownData.labels,
-                    datasets: [{{
+                    datasets: [{
                         label: 'Downtime (Hours)',
                         data: downtimeBreakdownData.values,
-                        backgroundColor: downtimeBreakdownData.values.map(value => {{
-                            if (value > 6) return chartColors.danger;      // Critical
-                            if (value > 3) return chartColors.warning;     // High  
-                            if (value > 1) return chartColors.secondary;   // Medium
-                            return chartColors.success;                    // Low
-                        }}),
+                        backgroundColor: downtimeBreakdownData.values.map(value => downtimeTierColors[downtimeTier(value)]),
                         borderWidth: 0,
                         borderRadius: 4,
                         borderSkipped: false
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
+                    // One value per date label, already in date order
+                    normalized: true,
+                    plugins: {
+                        legend: {
                             display: true,
                             position: 'top'
-                        }},
-                        tooltip: {{
-                            backgroundColor: 'rgba(44, 62, 80, 0.9)',
-                            titleColor: '#ffffff',
-                            bodyColor: '#ffffff',
-                            borderColor: chartColors.primary,
-                            borderWidth: 1,
-                            cornerRadius: 6,
-                            padding: 12,
-                            callbacks: {{
-                                label: function(context) {{
+                        },
+                        tooltip: {
+                            ...tooltipStyle,
+                            callbacks: {
+                                label: function(context) {
                                     return context.dataset.label + ': ' + context.raw + ' hours';
-                                }},
-                                afterLabel: function(context) {{
-                                    const value = context.raw;
-                                    const index = context.dataIndex;
-                                    let callouts = [];
-                                    
+                                },
+                                afterLabel: function(context) {
                                     // Downtime level assessment
-                                    if (value > 6) {{
-                                        callouts.push('🔴 Critical downtime level');
-                                        callouts.push('🚨 Immediate investigation required');
-                                        callouts.push('📊 Significantly impacts production');
-                                    }} else if (value > 3) {{
-                                        callouts.push('🟡 High downtime - needs attention');
-                                        callouts.push('⚠️ Consider preventive measures');
-                                        callouts.push('📈 Monitor trends closely');
-                                    }} else if (value > 1) {{
-                                        callouts.push('🟠 Moderate downtime');
-                                        callouts.push('📋 Review for optimization opportunities');
-                                    }} else {{
-                                        callouts.push('🟢 Low downtime - good performance');
-                                        callouts.push('✅ Within acceptable limits');
-                                    }}
+                                    const callouts = downtimeCallouts[downtimeTier(context.raw)];
                                     
                                     // Add machine count information if available
-                                    if (monthlyOeeData.machine_details && monthlyOeeData.machine_details[index]) {{
-                                        const machineCount = monthlyOeeData.machine_details[index].machine_count;
-                                        if (machineCount > 0) {{
-                                            callouts.push('🏭 Active Machines: ' + machineCount);
-                                        }}
-                                    }}
+                                    const details = monthlyOeeData.machine_details && monthlyOeeData.machine_details[context.dataIndex];
+                                    if (details && details.machine_count > 0) {
+                                        return callouts.concat('🏭 Active Machines: ' + details.machine_count);
+                                    }
                                     
                                     return callouts;
-                                }}
-                            }}
-                        }}
-                    }},
-                    scales: {{
-                        x: {{
-                            grid: {{
-                                color: 'rgba(149, 165, 166, 0.2)'
-                            }},
-                            ticks: {{
-                                font: {{
+                                }
+                            }
+                        }
+                    },
+                    scales: {
+                        x: {
+                            grid: gridLines,
+                            ticks: {
+                                font: {
                                     weight: '500'
-                                }}
-                            }}
-                        }},
-                        y: {{
+                                }
+                            }
+                        },
+                        y: {
                             beginAtZero: true,
-                            ticks: {{
-                                callback: function(value) {{
-                                    return value + 'h';
-                                }},
-                                font: {{
+                            ticks: {
+                                callback: hoursTick,
+                                font: {
                                     weight: '500'
-                                }}
-                            }},
-                            grid: {{
-                                color: 'rgba(149, 165, 166, 0.2)'
-                            }}
-                        }}
-                    }}
-                }}
-            }});
-        }}
-        
-        function updateDowntimeChart() {{
-            console.log('updateDowntimeChart called');
+                                }
+                            },
+                            grid: gridLines
+                        }
+                    }
+                }
+            });
+        }
+        
+        // Parsed date and short label ("Nov 7") cached on each report; the reports arrive sorted by date
+        currentMonthReports.forEach(report => {
+            if (report.date) {
+                report._parsedDate = new Date(report.date);
+                report._dateLabel = report._parsedDate.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+            }
+            
+            // Each category's share of the report's downtime, so a category filter is one lookup per report
+            const categories = report.downtime_categories;
+            if (categories) {
+                let categoryTotal = 0;
+                for (const minutes of Object.values(categories)) categoryTotal += minutes;
+                report._catRatio = {};
+                for (const name in categories) {
+                    report._catRatio[name] = categoryTotal > 0 ? categories[name] / categoryTotal : 0;
+                }
+            }
+        });
+        
+        // Index of the first report dated on or after `date`
+        function firstReportOnOrAfter(date) {
+            let lo = 0;
+            let hi = currentMonthReports.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                const parsed = currentMonthReports[mid]._parsedDate;
+                if (!parsed || parsed < date) lo = mid + 1;
+                else hi = mid;
+            }
+            return lo;
+        }
+        
+        // Filter changes are coalesced into at most one chart rebuild per frame
+        let downtimeUpdatePending = false;
+        let downtimeUpdateTrigger = null;
+        let downtimeSpinner = null;
+        
+        function updateDowntimeChart() {
+            // Only the most recent trigger gets the spinner once the frame runs
+            downtimeUpdateTrigger = window.event ? window.event.target : null;
+            if (downtimeUpdatePending) return;
+            downtimeUpdatePending = true;
+            requestAnimationFrame(() => {
+                downtimeUpdatePending = false;
+                renderDowntimeChart();
+                showDowntimeSpinner(downtimeUpdateTrigger);
+            });
+        }
+        
+        function showDowntimeSpinner(btn) {
+            if (!btn) return;
+            
+            // Restore any spinner still running from an earlier update before starting a new one
+            if (downtimeSpinner) {
+                clearTimeout(downtimeSpinner.timer);
+                downtimeSpinner.btn.innerHTML = downtimeSpinner.originalText;
+                downtimeSpinner.btn.disabled = false;
+            }
+            
+            const originalText = btn.innerHTML;
+            btn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Updating...';
+            btn.disabled = true;
+            
+            downtimeSpinner = {
+                btn,
+                originalText,
+                timer: setTimeout(() => {
+                    btn.innerHTML = originalText;
+                    btn.disabled = false;
+                    downtimeSpinner = null;
+                }, 1000)
+            };
+        }
+        
+        function renderDowntimeChart() {
+            console.log('renderDowntimeChart called');
             
             const machine = document.getElementById('machineSelect').value;
             const category = document.getElementById('downtimeCategory').value;
             const period = document.getElementById('timePeriod').value;
             
-            console.log('Updating chart with:', {{ machine, category, period }});
+            console.log('Updating chart with:', { machine, category, period });
             console.log('Current month reports:', currentMonthReports.length);
             
-            // Create structured data for the chart from actual reports
-            let chartData = {{}};
+            // Create structured data for the chart from actual reports in a single pass
+            const chartData = {};
             let chartLabels = [];
+            let firstIncluded = 0;
+            if (period === 'week') {
+                const weekAgo = new Date();
+                weekAgo.setDate(weekAgo.getDate() - 7);
+                firstIncluded = firstReportOnOrAfter(weekAgo);
+            }
             
-            // First, create labels from the actual report dates
-            currentMonthReports.forEach(report => {{
-                if (report.date) {{
-                    const dateLabel = new Date(report.date).toLocaleDateString('en-US', {{ month: 'short', day: 'numeric' }});
-                    if (!chartLabels.includes(dateLabel)) {{
-                        chartLabels.push(dateLabel);
-                        chartData[dateLabel] = 0;
-                    }}
-                }}
-            }});
-            
-            console.log('Chart labels created:', chartLabels);
-            
-            // Process data based on selections
-            currentMonthReports.forEach(report => {{
-                const dateLabel = new Date(report.date).toLocaleDateString('en-US', {{ month: 'short', day: 'numeric' }});
+            currentMonthReports.forEach((report, index) => {
+                if (!report.date) return;
+                
+                // Labels come from every report date, even ones the period filter skips
+                const dateLabel = report._dateLabel;
+                if (!(dateLabel in chartData)) {
+                    chartLabels.push(dateLabel);
+                    chartData[dateLabel] = 0;
+                }
+                
+                // Apply time period filter
+                if (index < firstIncluded) {
+                    return; // Skip this report
+                }
+                
                 let downtimeForThisDay = 0;
                 
                 // Machine filtering
-                if (machine === 'all') {{
+                if (machine === 'all') {
                     // Sum all machine downtime for this day
-                    if (report.downtime_machines) {{
-                        Object.values(report.downtime_machines).forEach(minutes => {{
+                    if (report.downtime_machines) {
+                        for (const minutes of Object.values(report.downtime_machines)) {
                             downtimeForThisDay += minutes / 60; // Convert to hours
-                        }});
-                    }} else if (report.downtime_hours) {{
+                        }
+                    } else if (report.downtime_hours) {
                         downtimeForThisDay = report.downtime_hours;
-                    }}
-                }} else {{
+                    }
+                } else if (report.downtime_machines && report.downtime_machines[machine]) {
                     // Specific machine downtime
-                    if (report.downtime_machines && report.downtime_machines[machine]) {{
-                        downtimeForThisDay = report.downtime_machines[machine] / 60; // Convert to hours
-                    }}
-                }}
+                    downtimeForThisDay = report.downtime_machines[machine] / 60; // Convert to hours
+                }
                 
                 // Category filtering (if applicable)
-                if (category !== 'all' && report.downtime_categories) {{
-                    const totalCategories = Object.values(report.downtime_categories).reduce((sum, val) => sum + val, 0);
-                    if (totalCategories > 0 && report.downtime_categories[category]) {{
-                        const categoryRatio = report.downtime_categories[category] / totalCategories;
-                        downtimeForThisDay *= categoryRatio;
-                    }} else if (!report.downtime_categories[category]) {{
-                        downtimeForThisDay = 0;
-                    }}
-                }}
-                
-                // Apply time period filter
-                if (period === 'week') {{
-                    const reportDate = new Date(report.date);
-                    const weekAgo = new Date();
-                    weekAgo.setDate(weekAgo.getDate() - 7);
-                    if (reportDate < weekAgo) {{
-                        return; // Skip this report
-                    }}
-                }}
+                if (category !== 'all' && report._catRatio) {
+                    downtimeForThisDay *= report._catRatio[category] || 0;
+                }
                 
                 chartData[dateLabel] = Math.max(chartData[dateLabel], downtimeForThisDay);
-            }});
+            });
+            
+            console.log('Chart labels created:', chartLabels);
             
             // Apply time period filter to labels and data
-            if (period === 'week') {{
+            if (period === 'week') {
                 chartLabels = chartLabels.slice(-7);
-            }}
+            }
             
             // Prepare final data arrays
             const finalData = chartLabels.map(label => Math.round((chartData[label] || 0) * 10) / 10);
@@ -3263,184 +2002,453 @@ def generate_bi_dashboard(reports, config, local_path):
             console.log('Final chart labels:', chartLabels);
             
             // Ensure we have valid data to display
-            if (finalData.length === 0 || finalData.every(val => val === 0)) {{
+            if (finalData.length === 0 || finalData.every(val => val === 0)) {
                 finalData.push(0);
                 chartLabels.push('No Data');
-            }}
+            }
             
             // Update chart with real filtered data
             downtimeChart.data.labels = chartLabels;
             downtimeChart.data.datasets[0].data = finalData;
             
-            // Update colors based on new values
-            downtimeChart.data.datasets[0].backgroundColor = finalData.map(value => {{
-                if (value > 6) return chartColors.danger;      // Critical
-                if (value > 3) return chartColors.warning;     // High  
-                if (value > 1) return chartColors.secondary;   // Medium
-                return chartColors.success;                    // Low
-            }});
+            // Update colors based on new values, reusing the dataset's colour array
+            const colors = downtimeChart.data.datasets[0].backgroundColor;
+            colors.length = finalData.length;
+            for (let i = 0; i < finalData.length; i++) {
+                colors[i] = downtimeTierColors[downtimeTier(finalData[i])];
+            }
             
-            downtimeChart.update();
+            downtimeChart.update('none');
             
-            // Update stats with real calculated values
-            const total = finalData.reduce((a, b) => a + b, 0);
+            // Update stats with real calculated values, in a single pass (downtime is never negative)
+            let total = 0;
+            let max = 0;
+            for (const value of finalData) {
+                total += value;
+                if (value > max) max = value;
+            }
             const avg = finalData.length > 0 ? total / finalData.length : 0;
-            const max = finalData.length > 0 ? Math.max(...finalData) : 0;
             
             document.getElementById('totalDowntime').textContent = total.toFixed(1) + 'h';
             document.getElementById('avgDowntime').textContent = avg.toFixed(1) + 'h';
             document.getElementById('maxDowntime').textContent = max.toFixed(1) + 'h';
+        }
+        
+        // Item analysis inputs and stat fields, looked up once; the script runs after the page body
+        const itemEls = {
+            dateFrom: document.getElementById('itemDateFrom'),
+            dateTo: document.getElementById('itemDateTo'),
+            search: document.getElementById('itemSearchInput'),
+            minParts: document.getElementById('minPartsFilter'),
+            minQuality: document.getElementById('minQualityFilter'),
+            minOee: document.getElementById('minOeeFilter'),
+            totalUniqueItems: document.getElementById('totalUniqueItems'),
+            totalItemProduction: document.getElementById('totalItemProduction'),
+            avgItemQuality: document.getElementById('avgItemQuality'),
+            topItemProduction: document.getElementById('topItemProduction'),
+            tableContainer: document.getElementById('itemTableContainer'),
+            tableBody: document.getElementById('itemTableBody')
+        };
+        
+        // ISO date ('YYYY-MM-DD') as the integer YYYYMMDD, so date filters compare numbers; 0 when empty
+        function dateNumber(isoDate) {
+            return parseInt(isoDate.replace(/-/g, '')) || 0;
+        }
+        
+        const DAY_MS = 24 * 60 * 60 * 1000;
+        
+        // Local calendar date of `date` as 'YYYY-MM-DD'; toISOString() alone gives the UTC date,
+        // which is the previous day for local midnights east of UTC
+        function isoDay(date) {
+            return new Date(date.getTime() - date.getTimezoneOffset() * 60000).toISOString().slice(0, 10);
+        }
+        
+        // Item data as parallel columns, built from itemAnalysisData on first use: typed arrays for the
+        // numeric fields the filters compare, plain arrays for the lowercased names and the row elements,
+        // which are only created once a row is scrolled into view
+        let itemCols = null;
+        let itemFilterButtons = null;
+        
+        // Running totals over the visible item rows, adjusted as rows are shown or hidden.
+        // Quality rates carry one decimal, so they are summed as integer tenths to stay exact.
+        const itemStats = { count: 0, parts: 0, qualityTenths: 0 };
+        
+        function getItemColumns() {
+            if (!itemCols) {
+                const count = itemAnalysisData.length;
+                itemCols = {
+                    count,
+                    el: new Array(count).fill(null),
+                    name: itemAnalysisData.map(item => String(item.item_name).toLowerCase()),
+                    // Float64 so comparisons against the typed-in thresholds stay exact
+                    totalParts: new Float64Array(count),
+                    quality: new Float64Array(count),
+                    qualityTenths: new Int32Array(count),
+                    oee: new Float64Array(count),
+                    machines: new Float64Array(count),
+                    firstDate: new Uint32Array(count),
+                    lastDate: new Uint32Array(count),
+                    shown: new Uint8Array(count).fill(1)
+                };
+                for (let i = 0; i < count; i++) {
+                    const item = itemAnalysisData[i];
+                    const totalParts = item.total_parts || 0;
+                    const quality = item.quality_rate || 0;
+                    itemCols.totalParts[i] = totalParts;
+                    itemCols.quality[i] = quality;
+                    itemCols.qualityTenths[i] = Math.round(quality * 10);
+                    itemCols.oee[i] = item.avg_oee || 0;
+                    itemCols.machines[i] = item.machine_count || 0;
+                    itemCols.firstDate[i] = dateNumber(item.first_date || '');
+                    itemCols.lastDate[i] = dateNumber(item.last_date || '');
+                    
+                    itemStats.count++;
+                    itemStats.parts += totalParts;
+                    itemStats.qualityTenths += itemCols.qualityTenths[i];
+                }
+            }
+            return itemCols;
+        }
+        
+        // Lowercased item names joined by newlines, with each name's start
+        // offset, so a search is a few indexOf scans over one string instead of an includes() per row
+        let itemNameIndex = null;
+        
+        function getItemNameIndex() {
+            if (!itemNameIndex) {
+                const { name } = getItemColumns();
+                const starts = new Uint32Array(name.length);
+                let offset = 0;
+                for (let i = 0; i < name.length; i++) {
+                    starts[i] = offset;
+                    offset += name[i].length + 1;
+                }
+                itemNameIndex = { text: name.join('\\n'), starts };
+            }
+            return itemNameIndex;
+        }
+        
+        // Flags for the item rows whose name contains the non-empty `term`
+        function matchItemNames(term) {
+            const { text, starts } = getItemNameIndex();
+            const matches = new Uint8Array(starts.length);
+            let pos = text.indexOf(term);
+            while (pos !== -1) {
+                // Row holding this match: the last name starting at or before it
+                let lo = 0;
+                let hi = starts.length - 1;
+                while (lo < hi) {
+                    const mid = (lo + hi + 1) >> 1;
+                    if (starts[mid] <= pos) lo = mid;
+                    else hi = mid - 1;
+                }
+                matches[lo] = 1;
+                // One hit per row is enough; resume at the next name
+                pos = lo + 1 < starts.length ? text.indexOf(term, starts[lo + 1]) : -1;
+            }
+            return matches;
+        }
+        
+        // Item row indexes sorted by a numeric column, built on first use per column
+        const itemRowOrders = {};
+        
+        function getItemRowOrder(field) {
+            if (!itemRowOrders[field]) {
+                const cols = getItemColumns();
+                const column = cols[field];
+                itemRowOrders[field] = new Uint32Array(cols.count)
+                    .map((_, index) => index)
+                    .sort((a, b) => column[a] - column[b]);
+            }
+            return itemRowOrders[field];
+        }
+        
+        // Indexes of the item rows whose `field` is at least `min`: a binary-searched tail of its sorted order
+        function itemRowsAtLeast(field, min) {
+            const column = getItemColumns()[field];
+            const order = getItemRowOrder(field);
+            let lo = 0;
+            let hi = order.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (column[order[mid]] < min) lo = mid + 1;
+                else hi = mid;
+            }
+            return order.subarray(lo);
+        }
+        
+        // Mark item row `i` shown or filtered out, updating the running totals; returns whether it changed
+        function setItemRowShown(i, show) {
+            const cols = itemCols;
+            if (cols.shown[i] === show) return false;
+            cols.shown[i] = show;
+            
+            const sign = show ? 1 : -1;
+            itemStats.count += sign;
+            itemStats.parts += sign * cols.totalParts[i];
+            itemStats.qualityTenths += sign * cols.qualityTenths[i];
+            return true;
+        }
+        
+        // Row CSS classes indexed by how many thresholds a value clears
+        const ITEM_QUALITY_CLASSES = ['quality-poor', 'quality-good', 'quality-excellent'];
+        const ITEM_OEE_CLASSES = ['oee-poor', 'oee-good', 'oee-excellent'];
+        
+        // Table row for item `i`, built on first use and kept for later windows
+        function getItemRow(i) {
+            const cols = itemCols;
+            if (!cols.el[i]) {
+                const item = itemAnalysisData[i];
+                const quality = cols.quality[i];
+                const oee = cols.oee[i];
+                const row = document.createElement('tr');
+                row.className = 'item-row';
+                [
+                    ['item-name', item.item_name],
+                    ['item-parts', cols.totalParts[i].toLocaleString('en-US')],
+                    ['', (item.ok_parts || 0).toLocaleString('en-US')],
+                    ['', (item.nok_parts || 0).toLocaleString('en-US')],
+                    ['item-quality ' + ITEM_QUALITY_CLASSES[(quality >= 90) + (quality >= 95)], quality.toFixed(1) + '%'],
+                    ['item-oee ' + ITEM_OEE_CLASSES[(oee >= 45) + (oee >= 70)], oee.toFixed(1) + '%'],
+                    ['', cols.machines[i]],
+                    ['', item.operator_count],
+                    ['', item.order_count],
+                    ['', item.report_count]
+                ].forEach(([className, text]) => {
+                    const cell = row.insertCell();
+                    if (className) cell.className = className;
+                    cell.textContent = text;
+                });
+                cols.el[i] = row;
+            }
+            return cols.el[i];
+        }
+        
+        // Only the shown rows within the scrolled viewport of the table, plus a buffer either side,
+        // are attached; two spacer rows stand in for the rest so the scroll height stays right
+        const ITEM_ROW_BUFFER = 10;
+        const ITEM_ROW_HEIGHT_DEFAULT = 45;
+        // Measured from laid-out rows; 0 until then, or while the table is hidden
+        let itemRowHeight = 0;
+        let itemShownRows = new Uint32Array(0);
+        let itemWindowStart = -1;
+        let itemWindowEnd = -1;
+        let itemWindowPending = false;
+        
+        function itemSpacerRow(height) {
+            const row = document.createElement('tr');
+            row.className = 'item-spacer';
+            const cell = row.insertCell();
+            cell.colSpan = 10;
+            cell.style.height = height + 'px';
+            return row;
+        }
+        
+        function renderItemWindow() {
+            const rows = itemShownRows;
+            const container = itemEls.tableContainer;
+            const rowHeight = itemRowHeight || ITEM_ROW_HEIGHT_DEFAULT;
+            // Windows start on an even row so the striping stays with the rows while scrolling
+            const first = Math.floor(container.scrollTop / rowHeight) - ITEM_ROW_BUFFER;
+            const start = Math.min(Math.max(0, first), rows.length) & ~1;
+            const end = Math.min(rows.length, start + Math.ceil(container.clientHeight / rowHeight) + 2 * ITEM_ROW_BUFFER);
+            if (start !== itemWindowStart || end !== itemWindowEnd) {
+                itemWindowStart = start;
+                itemWindowEnd = end;
+                
+                const fragment = document.createDocumentFragment();
+                fragment.appendChild(itemSpacerRow(start * rowHeight));
+                for (let k = start; k < end; k++) fragment.appendChild(getItemRow(rows[k]));
+                fragment.appendChild(itemSpacerRow((rows.length - end) * rowHeight));
+                itemEls.tableBody.replaceChildren(fragment);
+            }
             
-            // Show update animation
-            const btn = event.target;
-            const originalText = btn.innerHTML;
-            btn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Updating...';
-            btn.disabled = true;
-            
-            setTimeout(() => {{
-                btn.innerHTML = originalText;
-                btn.disabled = false;
-            }}, 1000);
-        }}
+            // Size the spacers from the real rows once they are laid out, then redo this window with it;
+            // a hidden table measures 0, so later renders keep trying until a measurement sticks
+            if (!itemRowHeight && end > start) {
+                const { rows: attached } = itemEls.tableBody;
+                const height = attached[end - start + 1].offsetTop - attached[1].offsetTop;
+                if (height > 0) {
+                    itemRowHeight = height / (end - start);
+                    itemWindowStart = -1;
+                    renderItemWindow();
+                }
+            }
+        }
+        
+        // Collect the shown rows, in their original order, and render the table from its top;
+        // filtered-out rows are never attached
+        function renderItemRows() {
+            const { count, shown } = getItemColumns();
+            const rows = new Uint32Array(itemStats.count);
+            let n = 0;
+            for (let i = 0; i < count; i++) {
+                if (shown[i]) rows[n++] = i;
+            }
+            itemShownRows = rows;
+            itemWindowStart = -1;
+            itemEls.tableContainer.scrollTop = 0;
+            renderItemWindow();
+        }
+        
+        // Scrolling moves the window at most once per frame
+        itemEls.tableContainer.addEventListener('scroll', () => {
+            if (itemWindowPending) return;
+            itemWindowPending = true;
+            requestAnimationFrame(() => {
+                itemWindowPending = false;
+                renderItemWindow();
+            });
+        }, { passive: true });
         
         // NEW: Item filtering functions
-        function filterItems(filterType) {{
-            const rows = document.querySelectorAll('.item-row');
-            const buttons = document.querySelectorAll('.item-filter-btn');
-            let visibleCount = 0;
-            
+        function filterItems(filterType) {
+            if (!itemFilterButtons) {
+                itemFilterButtons = document.querySelectorAll('.item-filter-btn');
+            }
             // Update active button
-            buttons.forEach(btn => btn.classList.remove('active'));
+            itemFilterButtons.forEach(btn => btn.classList.remove('active'));
             event.target.classList.add('active');
             
-            rows.forEach(row => {{
-                const totalParts = parseInt(row.getAttribute('data-total-parts')) || 0;
-                const quality = parseFloat(row.getAttribute('data-quality')) || 0;
-                const oee = parseFloat(row.getAttribute('data-oee')) || 0;
-                const machines = parseInt(row.getAttribute('data-machines')) || 0;
+            const { count, totalParts, quality, oee, machines } = getItemColumns();
+            let changed = false;
+            for (let i = 0; i < count; i++) {
                 let show = false;
                 
-                switch(filterType) {{
+                switch(filterType) {
                     case 'all': 
                         show = true; 
                         break;
                     case 'high-volume': 
-                        show = totalParts > 100; 
+                        show = totalParts[i] > 100; 
                         break;
                     case 'high-quality': 
-                        show = quality >= 95; 
+                        show = quality[i] >= 95; 
                         break;
                     case 'low-quality': 
-                        show = quality < 90; 
+                        show = quality[i] < 90; 
                         break;
                     case 'high-oee': 
-                        show = oee >= 70; 
+                        show = oee[i] >= 70; 
                         break;
                     case 'multi-machine': 
-                        show = machines > 1; 
+                        show = machines[i] > 1; 
                         break;
-                }}
+                }
                 
-                row.style.display = show ? 'table-row' : 'none';
-                if (show) visibleCount++;
-            }});
+                changed = setItemRowShown(i, show ? 1 : 0) || changed;
+            }
+            if (changed) renderItemRows();
             
-            console.log(`Item filter '${{filterType}}' applied, showing ${{visibleCount}} items`);
+            console.log(`Item filter '$${filterType}' applied, showing $${itemStats.count} items`);
             updateItemStats();
-        }}
+        }
         
-        function applyItemFilters() {{
-            const dateFrom = document.getElementById('itemDateFrom').value;
-            const dateTo = document.getElementById('itemDateTo').value;
-            const searchTerm = document.getElementById('itemSearchInput').value.toLowerCase();
-            const minParts = parseInt(document.getElementById('minPartsFilter').value) || 0;
-            const minQuality = parseFloat(document.getElementById('minQualityFilter').value) || 0;
-            const minOee = parseFloat(document.getElementById('minOeeFilter').value) || 0;
-            
-            const rows = document.querySelectorAll('.item-row');
-            let visibleCount = 0;
+        // Keystrokes and input changes are coalesced into one filter pass per frame,
+        // which reads the filter inputs as they stand when the frame runs
+        let itemFiltersPending = false;
+        
+        function applyItemFilters() {
+            if (itemFiltersPending) return;
+            itemFiltersPending = true;
+            requestAnimationFrame(() => {
+                itemFiltersPending = false;
+                runItemFilters();
+            });
+        }
+        
+        function runItemFilters() {
+            // An empty bound leaves that side of the range open
+            const dateFrom = dateNumber(itemEls.dateFrom.value);
+            const dateTo = dateNumber(itemEls.dateTo.value) || 99999999;
+            const searchTerm = itemEls.search.value.toLowerCase();
+            const minParts = parseInt(itemEls.minParts.value) || 0;
+            const minQuality = parseFloat(itemEls.minQuality.value) || 0;
+            const minOee = parseFloat(itemEls.minOee.value) || 0;
+            
+            const nameMatches = searchTerm ? matchItemNames(searchTerm) : null;
+            const { count, totalParts, quality, oee, firstDate, lastDate } = getItemColumns();
+            
+            // The most selective minimum threshold bounds the candidate rows; every other row is
+            // rejected on its candidate flag without evaluating the remaining predicates
+            let candidates = null;
+            [['totalParts', minParts], ['quality', minQuality], ['oee', minOee]].forEach(([field, min]) => {
+                if (min <= 0) return;
+                const atLeast = itemRowsAtLeast(field, min);
+                if (!candidates || atLeast.length < candidates.length) candidates = atLeast;
+            });
+            const isCandidate = new Uint8Array(count);
+            if (candidates) {
+                for (const index of candidates) isCandidate[index] = 1;
+            } else {
+                isCandidate.fill(1);
+            }
             
-            rows.forEach(row => {{
-                const itemName = row.getAttribute('data-item-name') || '';
-                const totalParts = parseInt(row.getAttribute('data-total-parts')) || 0;
-                const quality = parseFloat(row.getAttribute('data-quality')) || 0;
-                const oee = parseFloat(row.getAttribute('data-oee')) || 0;
-                const firstDate = row.getAttribute('data-first-date') || '';
-                const lastDate = row.getAttribute('data-last-date') || '';
-                
-                const matchesSearch = itemName.includes(searchTerm);
-                const matchesParts = totalParts >= minParts;
-                const matchesQuality = quality >= minQuality;
-                const matchesOee = oee >= minOee;
+            let changed = false;
+            for (let i = 0; i < count; i++) {
+                // Item must match the search, meet each minimum and have been produced within the date range
+                const show = isCandidate[i] === 1
+                    && (!nameMatches || nameMatches[i] === 1)
+                    && totalParts[i] >= minParts
+                    && quality[i] >= minQuality
+                    && oee[i] >= minOee
+                    && firstDate[i] <= dateTo
+                    && lastDate[i] >= dateFrom;
                 
-                // NEW: Date filtering logic
-                let matchesDate = true;
-                if (dateFrom || dateTo) {{
-                    if (dateFrom && dateTo) {{
-                        // Item must have been produced within the date range
-                        matchesDate = (firstDate <= dateTo) && (lastDate >= dateFrom);
-                    }} else if (dateFrom) {{
-                        // Item must have been produced on or after dateFrom
-                        matchesDate = lastDate >= dateFrom;
-                    }} else if (dateTo) {{
-                        // Item must have been produced on or before dateTo
-                        matchesDate = firstDate <= dateTo;
-                    }}
-                }}
-                
-                const show = matchesSearch && matchesParts && matchesQuality && matchesOee && matchesDate;
-                
-                row.style.display = show ? 'table-row' : 'none';
-                if (show) visibleCount++;
-            }});
+                changed = setItemRowShown(i, show ? 1 : 0) || changed;
+            }
+            if (changed) renderItemRows();
             
-            console.log(`Applied filters - showing ${{visibleCount}} items`);
+            console.log(`Applied filters - showing $${itemStats.count} items`);
             updateItemStats();
-        }}
+        }
         
-        function updateItemStats() {{
-            const visibleRows = document.querySelectorAll('.item-row[style*="table-row"], .item-row:not([style*="none"])');
-            let totalParts = 0;
-            let qualitySum = 0;
-            let maxParts = 0;
+        function updateItemStats() {
+            const { totalParts, shown } = getItemColumns();
             
-            visibleRows.forEach(row => {{
-                const parts = parseInt(row.getAttribute('data-total-parts')) || 0;
-                const quality = parseFloat(row.getAttribute('data-quality')) || 0;
-                totalParts += parts;
-                qualitySum += quality;
-                maxParts = Math.max(maxParts, parts);
-            }});
+            // Top production: walk the parts order down from the largest to the first visible row
+            const byParts = getItemRowOrder('totalParts');
+            let maxParts = 0;
+            for (let k = byParts.length - 1; k >= 0; k--) {
+                if (shown[byParts[k]]) {
+                    maxParts = totalParts[byParts[k]];
+                    break;
+                }
+            }
             
-            const avgQuality = visibleRows.length > 0 ? (qualitySum / visibleRows.length).toFixed(1) : 0;
+            const { count, parts, qualityTenths } = itemStats;
+            const avgQuality = count > 0 ? (qualityTenths / count / 10).toFixed(1) : 0;
             
-            document.getElementById('totalUniqueItems').textContent = visibleRows.length;
-            document.getElementById('totalItemProduction').textContent = totalParts.toLocaleString();
-            document.getElementById('avgItemQuality').textContent = avgQuality + '%';
-            document.getElementById('topItemProduction').textContent = maxParts.toLocaleString();
-        }}
+            itemEls.totalUniqueItems.textContent = count;
+            itemEls.totalItemProduction.textContent = parts.toLocaleString();
+            itemEls.avgItemQuality.textContent = avgQuality + '%';
+            itemEls.topItemProduction.textContent = maxParts.toLocaleString();
+        }
         
         // NEW: Quick date range function for item analysis
-        function setItemDateRange(range) {{
+        function setItemDateRange(range) {
             const today = new Date();
-            const itemDateFrom = document.getElementById('itemDateFrom');
-            const itemDateTo = document.getElementById('itemDateTo');
+            const year = today.getFullYear();
+            const month = today.getMonth();
+            const day = today.getDate();
+            const { dateFrom: itemDateFrom, dateTo: itemDateTo } = itemEls;
             
+            // Calendar arithmetic on local dates, so DST changes never shift a day
             let startDate, endDate;
             
-            switch(range) {{
+            switch(range) {
                 case 'today':
                     startDate = endDate = today;
                     break;
                 case 'yesterday':
-                    startDate = endDate = new Date(today.getTime() - 24 * 60 * 60 * 1000);
+                    startDate = endDate = new Date(year, month, day - 1);
                     break;
                 case 'week':
-                    startDate = new Date(today.getTime() - today.getDay() * 24 * 60 * 60 * 1000);
+                    startDate = new Date(year, month, day - today.getDay());
                     endDate = today;
                     break;
                 case 'month':
-                    startDate = new Date(today.getFullYear(), today.getMonth(), 1);
+                    startDate = new Date(year, month, 1);
                     endDate = today;
                     break;
                 case 'all':
@@ -3448,249 +2456,313 @@ def generate_bi_dashboard(reports, config, local_path):
                     itemDateTo.value = '';
                     applyItemFilters();
                     return;
-            }}
+            }
             
-            itemDateFrom.value = startDate.toISOString().split('T')[0];
-            itemDateTo.value = endDate.toISOString().split('T')[0];
+            itemDateFrom.value = isoDay(startDate);
+            itemDateTo.value = isoDay(endDate);
             applyItemFilters();
-        }}
+        }
         
         // Enhanced date filtering functions
-        function setQuickDateRange(range) {{
+        let quickFilterButtons = null;
+        
+        function setQuickDateRange(range) {
             const today = new Date();
+            const year = today.getFullYear();
+            const month = today.getMonth();
+            const day = today.getDate();
             const dateFrom = document.getElementById('dateFrom');
             const dateTo = document.getElementById('dateTo');
             
             // Remove active class from all quick filter buttons
-            document.querySelectorAll('.quick-filter-btn').forEach(btn => btn.classList.remove('active'));
+            if (!quickFilterButtons) {
+                quickFilterButtons = document.querySelectorAll('.quick-filter-btn');
+            }
+            quickFilterButtons.forEach(btn => btn.classList.remove('active'));
             event.target.classList.add('active');
             
+            // Calendar arithmetic on local dates, so DST changes never shift a day
             let startDate, endDate;
             
-            switch(range) {{
+            switch(range) {
                 case 'today':
                     startDate = endDate = today;
                     break;
                 case 'yesterday':
-                    startDate = endDate = new Date(today.getTime() - 24 * 60 * 60 * 1000);
+                    startDate = endDate = new Date(year, month, day - 1);
                     break;
                 case 'week':
-                    startDate = new Date(today.getTime() - today.getDay() * 24 * 60 * 60 * 1000);
+                    startDate = new Date(year, month, day - today.getDay());
                     endDate = today;
                     break;
                 case 'lastweek':
-                    endDate = new Date(today.getTime() - today.getDay() * 24 * 60 * 60 * 1000 - 1);
-                    startDate = new Date(endDate.getTime() - 6 * 24 * 60 * 60 * 1000);
+                    endDate = new Date(year, month, day - today.getDay() - 1);
+                    startDate = new Date(year, month, day - today.getDay() - 7);
                     break;
                 case 'month':
-                    startDate = new Date(today.getFullYear(), today.getMonth(), 1);
+                    startDate = new Date(year, month, 1);
                     endDate = today;
                     break;
                 case 'lastmonth':
-                    startDate = new Date(today.getFullYear(), today.getMonth() - 1, 1);
-                    endDate = new Date(today.getFullYear(), today.getMonth(), 0);
+                    startDate = new Date(year, month - 1, 1);
+                    endDate = new Date(year, month, 0);
                     break;
-            }}
+            }
             
-            dateFrom.value = startDate.toISOString().split('T')[0];
-            dateTo.value = endDate.toISOString().split('T')[0];
-        }}
+            dateFrom.value = isoDay(startDate);
+            dateTo.value = isoDay(endDate);
+        }
         
-        function filterReports(filter) {{
-            const cards = document.querySelectorAll('.report-card');
-            const sections = document.querySelectorAll('.folder-section');
-            const today = new Date().toISOString().split('T')[0];
-            const weekAgo = new Date(Date.now() - 7 * 24 * 60 * 60 * 1000).toISOString().split('T')[0];
-            const monthAgo = new Date(Date.now() - 30 * 24 * 60 * 60 * 1000).toISOString().split('T')[0];
-            
-            updateActiveButton(event.target);
-            let visibleCount = 0;
+        // Report cards grouped by folder section, with their attributes read once on first filter
+        let reportSections = null;
+        
+        // Card fields a search matches, besides the filename in data-search; the first .metric-value
+        // is the total parts. Static labels and the other metrics stay out so they do not match every card.
+        const REPORT_SEARCH_SELECTORS = ['.report-date', '.report-title', '.report-day', '.report-status', '.main-oee-value', '.metric-value'];
+        
+        function reportSearchText(card) {
+            const fields = REPORT_SEARCH_SELECTORS.map(selector => card.querySelector(selector).textContent);
+            fields.push(card.dataset.search);
+            return fields.join(' ').replace(/\\s+/g, ' ').toLowerCase();
+        }
+        
+        function getReportSections() {
+            if (!reportSections) {
+                // `shown` mirrors the element's .hidden class so filters only touch changed elements
+                reportSections = Array.from(document.getElementsByClassName('folder-section'), section => ({
+                    el: section,
+                    shown: true,
+                    cards: Array.from(section.getElementsByClassName('report-card'), card => ({
+                        el: card,
+                        shown: true,
+                        date: dateNumber(card.dataset.date),
+                        search: reportSearchText(card)
+                    }))
+                }));
+            }
+            return reportSections;
+        }
+        
+        // Report filter state: the advanced buttons pick a generated filter class ('' for all reports),
+        // the date controls an inclusive YYYYMMDD window and the search box a lowercase term.
+        // Each control updates its own part, and the cards are filtered against all of them together.
+        const REPORT_DATE_OPEN = { from: 0, to: 99999999 };
+        const reportFilters = { className: '', dateFrom: REPORT_DATE_OPEN.from, dateTo: REPORT_DATE_OPEN.to, search: '' };
+        let reportFiltersPending = false;
+        let reportCardsToggled = false;
+        
+        // Re-filter the report cards in the next animation frame, once however many controls changed
+        function applyReportFilters() {
+            if (reportFiltersPending) return;
+            reportFiltersPending = true;
+            
+            requestAnimationFrame(() => {
+                reportFiltersPending = false;
+                const { className, dateFrom, dateTo, search } = reportFilters;
+                if (dateFrom === REPORT_DATE_OPEN.from && dateTo === REPORT_DATE_OPEN.to && !search) {
+                    applyReportClassFilter(className);
+                } else {
+                    applyReportPredicate(className, dateFrom, dateTo, search);
+                }
+            });
+        }
+        
+        // Class filter alone: rewrite the #filterRules stylesheet instead of visiting every card
+        function applyReportClassFilter(className) {
+            // Undo any card-by-card filtering so the stylesheet rule alone decides visibility
+            if (reportCardsToggled) {
+                getReportSections().forEach(section => {
+                    setShown(section, true);
+                    section.cards.forEach(card => setShown(card, true));
+                });
+                reportCardsToggled = false;
+            }
             
-            sections.forEach(section => section.style.display = 'block');
+            document.getElementById('filterRules').textContent = className
+                ? `.folder-section:not(.$${className}), .report-card:not(.$${className}) { display: none; }`
+                : '';
+            toggleNoResults(document.querySelectorAll(className ? '.report-card.' + className : '.report-card').length);
+        }
+        
+        // Date window or search: test each cached card against every filter in one pass
+        function applyReportPredicate(className, dateFrom, dateTo, search) {
+            document.getElementById('filterRules').textContent = '';
+            reportCardsToggled = true;
             
-            cards.forEach(card => {{
-                const date = card.getAttribute('data-date');
-                let show = false;
-                
-                switch(filter) {{
-                    case 'all': show = true; break;
-                    case 'today': show = date === today; break;
-                    case 'week': show = date >= weekAgo; break;
-                    case 'month': show = date >= monthAgo; break;
-                }}
-                
-                card.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
+            // The date window is located by binary search, so each card is then tested with a rank comparison
+            const lo = firstCardOnOrAfter(dateFrom);
+            const hi = firstCardOnOrAfter(dateTo + 1);
+            let visibleCount = 0;
             
-            sections.forEach(section => {{
-                const visibleCards = section.querySelectorAll('.report-card[style*="block"], .report-card:not([style*="none"])');
-                if (visibleCards.length === 0) {{
-                    section.style.display = 'none';
-                }}
-            }});
+            getReportSections().forEach(section => {
+                let sectionCount = 0;
+                section.cards.forEach(card => {
+                    const show = card.dateRank >= lo && card.dateRank < hi
+                        && (!search || card.search.includes(search))
+                        && (!className || card.el.classList.contains(className));
+                    setShown(card, show);
+                    if (show) sectionCount++;
+                });
+                setShown(section, sectionCount > 0);
+                visibleCount += sectionCount;
+            });
             
             toggleNoResults(visibleCount);
-        }}
+        }
         
-        function filterByOEE(level) {{
-            const cards = document.querySelectorAll('.report-card');
-            const sections = document.querySelectorAll('.folder-section');
-            updateActiveButton(event.target);
-            let visibleCount = 0;
-            
-            sections.forEach(section => section.style.display = 'block');
-            
-            cards.forEach(card => {{
-                const oee = parseFloat(card.getAttribute('data-oee')) || 0;
-                let show = false;
-                
-                switch(level) {{
-                    case 'good': show = oee >= 70; break;
-                    case 'fair': show = oee >= 45 && oee < 70; break;
-                    case 'poor': show = oee > 0 && oee < 45; break;
-                }}
-                
-                card.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
+        // Toggle .hidden on a cached card or section only when its visibility changes
+        function setShown(entry, show) {
+            if (entry.shown !== show) {
+                entry.shown = show;
+                entry.el.classList.toggle('hidden', !show);
+            }
+        }
+        
+        // Report cards in date order (ties keep page order), each tagged with its rank in that order
+        let reportCardsByDate = null;
+        
+        function getReportCardsByDate() {
+            if (!reportCardsByDate) {
+                reportCardsByDate = getReportSections().flatMap(section => section.cards);
+                reportCardsByDate.sort((a, b) => a.date - b.date);
+                reportCardsByDate.forEach((card, rank) => {
+                    card.dateRank = rank;
+                });
+            }
+            return reportCardsByDate;
+        }
+        
+        // Rank of the first card dated on or after `date` (YYYYMMDD)
+        function firstCardOnOrAfter(date) {
+            const cards = getReportCardsByDate();
+            let lo = 0;
+            let hi = cards.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (cards[mid].date < date) lo = mid + 1;
+                else hi = mid;
+            }
+            return lo;
+        }
+        
+        function setReportDateWindow(from, to) {
+            reportFilters.dateFrom = from;
+            reportFilters.dateTo = to;
+        }
+        
+        function filterReports(filter) {
+            const now = Date.now();
+            const today = dateNumber(isoDay(new Date(now)));
+            const weekAgo = dateNumber(isoDay(new Date(now - 7 * DAY_MS)));
+            const monthAgo = dateNumber(isoDay(new Date(now - 30 * DAY_MS)));
             
-            sections.forEach(section => {{
-                const visibleCards = section.querySelectorAll('.report-card[style*="block"], .report-card:not([style*="none"])');
-                if (visibleCards.length === 0) {{
-                    section.style.display = 'none';
-                }}
-            }});
+            updateActiveButton(event.target);
             
-            toggleNoResults(visibleCount);
-        }}
+            // 'All Reports' clears the class and date filters; the search box keeps its term.
+            // The relative windows follow the viewing date, so they are date windows, not generated classes.
+            switch(filter) {
+                case 'all':
+                    reportFilters.className = '';
+                    setReportDateWindow(REPORT_DATE_OPEN.from, REPORT_DATE_OPEN.to);
+                    break;
+                case 'today': setReportDateWindow(today, today); break;
+                case 'week': setReportDateWindow(weekAgo, REPORT_DATE_OPEN.to); break;
+                case 'month': setReportDateWindow(monthAgo, REPORT_DATE_OPEN.to); break;
+            }
+            applyReportFilters();
+        }
         
-        function filterByQuality(level) {{
-            const cards = document.querySelectorAll('.report-card');
-            const sections = document.querySelectorAll('.folder-section');
+        function filterByOEE(level) {
             updateActiveButton(event.target);
-            let visibleCount = 0;
-            
-            sections.forEach(section => section.style.display = 'block');
             
-            cards.forEach(card => {{
-                const quality = parseFloat(card.getAttribute('data-quality')) || 0;
-                let show = false;
-                
-                if (level === 'high') {{
-                    show = quality >= 95;
-                }}
-                
-                card.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
-            
-            sections.forEach(section => {{
-                const visibleCards = section.querySelectorAll('.report-card[style*="block"], .report-card:not([style*="none"])');
-                if (visibleCards.length === 0) {{
-                    section.style.display = 'none';
-                }}
-            }});
+            reportFilters.className = 'filter-oee-' + level;
+            applyReportFilters();
+        }
+        
+        function filterByQuality(level) {
+            updateActiveButton(event.target);
             
-            toggleNoResults(visibleCount);
-        }}
+            reportFilters.className = 'filter-quality-' + level;
+            applyReportFilters();
+        }
         
-        function filterByDateRange() {{
+        function filterByDateRange() {
             const dateFrom = document.getElementById('dateFrom').value;
             const dateTo = document.getElementById('dateTo').value;
             
-            if (!dateFrom || !dateTo) {{
+            if (!dateFrom || !dateTo) {
                 alert('Please select both start and end dates');
                 return;
-            }}
-            
-            const cards = document.querySelectorAll('.report-card');
-            const sections = document.querySelectorAll('.folder-section');
-            let visibleCount = 0;
-            
-            sections.forEach(section => section.style.display = 'block');
-            
-            cards.forEach(card => {{
-                const date = card.getAttribute('data-date');
-                const show = date >= dateFrom && date <= dateTo;
-                
-                card.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
-            
-            sections.forEach(section => {{
-                const visibleCards = section.querySelectorAll('.report-card[style*="block"], .report-card:not([style*="none"])');
-                if (visibleCards.length === 0) {{
-                    section.style.display = 'none';
-                }}
-            }});
+            }
             
-            toggleNoResults(visibleCount);
-        }}
+            setReportDateWindow(dateNumber(dateFrom), dateNumber(dateTo));
+            applyReportFilters();
+        }
         
-        function updateActiveButton(activeBtn) {{
-            document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+        let reportFilterButtons = null;
+        
+        function updateActiveButton(activeBtn) {
+            if (!reportFilterButtons) {
+                reportFilterButtons = document.querySelectorAll('.filter-btn');
+            }
+            reportFilterButtons.forEach(btn => btn.classList.remove('active'));
             activeBtn.classList.add('active');
-        }}
+        }
+        
+        const noResultsEl = document.getElementById('noResults');
         
-        function toggleNoResults(count) {{
-            document.getElementById('noResults').style.display = count === 0 ? 'block' : 'none';
-        }}
+        function toggleNoResults(count) {
+            noResultsEl.style.display = count === 0 ? 'block' : 'none';
+        }
         
         // Enhanced search
-        function searchReports() {{
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            const cards = document.querySelectorAll('.report-card');
-            const sections = document.querySelectorAll('.folder-section');
-            let visibleCount = 0;
-            
-            cards.forEach(card => {{
-                const searchData = card.getAttribute('data-search').toLowerCase();
-                const show = searchData.includes(searchTerm);
-                
-                card.style.display = show ? 'block' : 'none';
-                if (show) visibleCount++;
-            }});
-            
-            sections.forEach(section => {{
-                const visibleCards = section.querySelectorAll('.report-card[style*="block"], .report-card:not([style*="none"])');
-                section.style.display = visibleCards.length > 0 ? 'block' : 'none';
-            }});
-            
-            toggleNoResults(visibleCount);
-        }}
+        function searchReports() {
+            reportFilters.search = document.getElementById('searchInput').value.toLowerCase();
+            applyReportFilters();
+        }
+        
+        // Run `fn` once input has been quiet for `ms` milliseconds
+        function debounce(fn, ms) {
+            let timer;
+            return (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), ms);
+            };
+        }
         
-        // Add event listeners for item filters
-        document.getElementById('itemDateFrom').addEventListener('change', applyItemFilters);
-        document.getElementById('itemDateTo').addEventListener('change', applyItemFilters);
-        document.getElementById('itemSearchInput').addEventListener('keyup', applyItemFilters);
-        document.getElementById('minPartsFilter').addEventListener('input', applyItemFilters);
-        document.getElementById('minQualityFilter').addEventListener('input', applyItemFilters);
-        document.getElementById('minOeeFilter').addEventListener('input', applyItemFilters);
+        // Add event listeners for item filters; typing only filters after a 100ms pause
+        const debouncedItemFilters = debounce(applyItemFilters, 100);
+        itemEls.dateFrom.addEventListener('change', applyItemFilters);
+        itemEls.dateTo.addEventListener('change', applyItemFilters);
+        itemEls.search.addEventListener('keyup', debouncedItemFilters);
+        itemEls.minParts.addEventListener('input', debouncedItemFilters);
+        itemEls.minQuality.addEventListener('input', debouncedItemFilters);
+        itemEls.minOee.addEventListener('input', debouncedItemFilters);
         
-        document.getElementById('searchInput').addEventListener('keyup', searchReports);
+        document.getElementById('searchInput').addEventListener('keyup', debounce(searchReports, 100));
         
         // Set default date range (current month) for reports
         const today = new Date();
-        const firstDayOfMonth = new Date(today.getFullYear(), today.getMonth(), 1);
+        const todayISO = isoDay(today);
+        const firstDayOfMonthISO = isoDay(new Date(today.getFullYear(), today.getMonth(), 1));
         
-        document.getElementById('dateTo').value = today.toISOString().split('T')[0];
-        document.getElementById('dateFrom').value = firstDayOfMonth.toISOString().split('T')[0];
+        document.getElementById('dateTo').value = todayISO;
+        document.getElementById('dateFrom').value = firstDayOfMonthISO;
         
         // Set default date range for item analysis (current month)
-        document.getElementById('itemDateFrom').value = firstDayOfMonth.toISOString().split('T')[0];
-        document.getElementById('itemDateTo').value = today.toISOString().split('T')[0];
+        itemEls.dateFrom.value = firstDayOfMonthISO;
+        itemEls.dateTo.value = todayISO;
         
         // Keyboard shortcuts
-        document.addEventListener('keydown', function(e) {{
-            if (e.ctrlKey && e.key === 'f') {{
+        document.addEventListener('keydown', function(e) {
+            if (e.ctrlKey && e.key === 'f') {
                 e.preventDefault();
                 document.getElementById('searchInput').focus();
-            }}
-        }});
+            }
+        });
         
         // Initialize everything
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             console.log('Dashboard initializing...');
             console.log('Monthly OEE data:', monthlyOeeData);
             console.log('Monthly parts data:', monthlyPartsData);
@@ -3700,15 +2772,457 @@ def generate_bi_dashboard(reports, config, local_path):
             console.log('Current month reports:', currentMonthReports.length, 'reports');
             
             initializeCharts();
+            renderItemRows();
             updateItemStats(); // Initialize item stats
             
             console.log('Dashboard initialization complete');
-        }});
+        });
     </script>
 </body>
-</html>"""
+</html>""")
+
+def write_dashboard_css(output_dir):
+    """Write the minified dashboard.css next to the generated dashboards, skipping it when its content is unchanged"""
+    target = os.path.join(output_dir, DASHBOARD_CSS_PATH.name)
+    try:
+        with open(target, encoding='utf-8') as f:
+            current = f.read()
+    except (OSError, UnicodeDecodeError):
+        current = None
+    if current != _DASHBOARD_CSS:
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(_DASHBOARD_CSS)
+    return target
+
+def generate_bi_dashboard(reports, config, local_path, out=None):
+    """Generate professional BI dashboard with red theme, streamed into `out` when a file object is given"""
+    chunks = iter_bi_dashboard_html(reports, config, local_path)
+    if out is not None:
+        out.writelines(chunks)
+        return None
+    return "".join(chunks)
+
+def iter_bi_dashboard_html(reports, config, local_path):
+    """Yield the BI dashboard HTML section by section so it can be streamed to disk"""
+    
+    # Calculate current month statistics from a single clock reading
+    now = datetime.now()
+    current_month = now.strftime('%Y-%m')
+    current_month_name = now.strftime('%B %Y')
+    last_updated = now.strftime('%Y-%m-%d %H:%M')
+    
+    # Filter reports for current month, sorted once by date for every chart helper
+    current_month_reports = sorted(
+        (r for r in reports if r.get('date', '').startswith(current_month)),
+        key=itemgetter('date')
+    )
+    
+    # Calculate current month averages
+    current_month_oee_values = [r['main_oee'] for r in current_month_reports if r['main_oee'] is not None]
+    current_month_avg_oee = round(sum(current_month_oee_values) / len(current_month_oee_values), 1) if current_month_oee_values else None
+    
+    current_month_quality_values = [r['quality_rate'] for r in current_month_reports if r['quality_rate'] is not None]
+    current_month_avg_quality = round(sum(current_month_quality_values) / len(current_month_quality_values), 1) if current_month_quality_values else None
+    
+    current_month_total_parts = sum([r['total_parts'] for r in current_month_reports if r['total_parts'] is not None])
+    
+    current_month_downtime_values = [r['downtime_hours'] for r in current_month_reports if r['downtime_hours'] is not None]
+    current_month_total_downtime = sum(current_month_downtime_values) if current_month_downtime_values else 0
+    current_month_avg_downtime = current_month_total_downtime / len(current_month_reports) if current_month_reports else 0
+    current_month_peak_downtime = max(current_month_downtime_values, default=0)
+    
+    # KPI cards, formatted once so the card template only substitutes
+    kpi_cards = [
+        {'css_class': 'oee', 'icon': 'fa-chart-line', 'label': 'Average OEE',
+         'value': fmt_pct(current_month_avg_oee)},
+        {'css_class': 'quality', 'icon': 'fa-star', 'label': 'Average Quality',
+         'value': fmt_pct(current_month_avg_quality)},
+        {'css_class': 'parts', 'icon': 'fa-cogs', 'label': 'Total Parts',
+         'value': f"{current_month_total_parts:,}"},
+    ]
+    
+    # Prepare monthly OK/NOK parts data for doughnut chart
+    monthly_parts_data = prepare_monthly_parts_data(current_month_reports)
+    
+    # Prepare monthly OEE data for chart
+    monthly_oee_data = prepare_monthly_oee_data(current_month_reports)
+    
+    # Prepare downtime breakdown data
+    downtime_breakdown_data = prepare_downtime_breakdown_data(current_month_reports)
+    
+    # Machine and category names, collected once for the downtime data and the filter dropdowns
+    sorted_machines, sorted_categories = collect_downtime_dimensions(current_month_reports)
+    
+    # Prepare machine downtime data for interactive section
+    machine_downtime_data = prepare_machine_downtime_data(current_month_reports, sorted_machines, sorted_categories)
+    
+    # Prepare category breakdown data for new chart
+    category_breakdown_data = prepare_category_breakdown_data(current_month_reports)
+    
+    # Average machine OEE for the machine chart
+    machine_oee_data = prepare_machine_oee_data(current_month_reports)
+    
+    # NEW: Prepare item analysis data
+    item_analysis_data = prepare_item_analysis_data(current_month_reports, config.get('item_table_limit'))
+    
+    # Group by folders
+    folders = {}
+    for report in reports:
+        folder = report['parent_folder']
+        if folder not in folders:
+            folders[folder] = []
+        folders[folder].append(report)
+    
+    # Safely prepare JSON data for JavaScript
+    try:
+        monthly_oee_json = _encode_json(monthly_oee_data)
+    except Exception as e:
+        print(f"Error serializing monthly OEE data: {e}")
+        monthly_oee_json = '{"labels": [], "values": [], "machine_details": []}'
+        
+    try:
+        monthly_parts_json = _encode_json(monthly_parts_data)
+    except Exception as e:
+        print(f"Error serializing monthly parts data: {e}")
+        monthly_parts_json = '{"ok_parts": 0, "nok_parts": 0}'
+        
+    try:
+        downtime_breakdown_json = _encode_json(downtime_breakdown_data)
+    except Exception as e:
+        print(f"Error serializing downtime breakdown data: {e}")
+        downtime_breakdown_json = '{"labels": [], "values": [], "category_breakdown": {}, "machine_breakdown": {}}'
+        
+    try:
+        machine_downtime_json = _encode_json(machine_downtime_data)
+    except Exception as e:
+        print(f"Error serializing machine downtime data: {e}")
+        machine_downtime_json = '{}'
+    
+    try:
+        category_breakdown_json = _encode_json(category_breakdown_data)
+    except Exception as e:
+        print(f"Error serializing category breakdown data: {e}")
+        category_breakdown_json = '{}'
+    
+    try:
+        machine_oee_json = _encode_json(machine_oee_data)
+    except Exception as e:
+        print(f"Error serializing machine OEE data: {e}")
+        machine_oee_json = '[]'
+    
+    try:
+        item_analysis_json = _encode_json(item_analysis_data)
+    except Exception as e:
+        print(f"Error serializing item analysis data: {e}")
+        item_analysis_json = '[]'
+    
+    # Prepare safe current month reports for JavaScript
+    safe_reports = []
+    for r in current_month_reports:
+        try:
+            safe_report = {
+                'date': str(r.get('date', '')),
+                'top_operators': [],
+                'downtime_categories': {},
+                'downtime_machines': {},
+                'downtime_hours': 0
+            }
+            
+            # Safely process top_operators
+            if isinstance(r.get('top_operators'), list):
+                for operator in r['top_operators']:
+                    if isinstance(operator, dict):
+                        name = operator.get('name', '')
+                        oee = operator.get('oee', 0)
+                        if isinstance(name, str) and isinstance(oee, (int, float)):
+                            safe_report['top_operators'].append({
+                                'name': str(name),
+                                'oee': float(oee)
+                            })
+            
+            # Safely process downtime_categories
+            if isinstance(r.get('downtime_categories'), dict):
+                for key, value in r['downtime_categories'].items():
+                    if isinstance(key, str) and isinstance(value, (int, float)):
+                        safe_report['downtime_categories'][str(key)] = float(value)
+            
+            # Safely process downtime_machines
+            if isinstance(r.get('downtime_machines'), dict):
+                for key, value in r['downtime_machines'].items():
+                    if isinstance(key, str) and isinstance(value, (int, float)):
+                        safe_report['downtime_machines'][str(key)] = float(value)
+            
+            # Safely process downtime_hours
+            downtime_hours = r.get('downtime_hours', 0)
+            if isinstance(downtime_hours, (int, float)):
+                safe_report['downtime_hours'] = float(downtime_hours)
+            
+            safe_reports.append(safe_report)
+            
+        except Exception as e:
+            print(f"Error processing report for JSON: {e}")
+            # Add a minimal safe report
+            safe_reports.append({
+                'date': str(r.get('date', 'unknown')),
+                'top_operators': [],
+                'downtime_categories': {},
+                'downtime_machines': {},
+                'downtime_hours': 0
+            })
+    
+    try:
+        current_month_reports_json = _encode_json(safe_reports)
+    except Exception as e:
+        print(f"Error serializing current month reports: {e}")
+        current_month_reports_json = '[]'
+    
+    # Item summary cards, reduced column-wise by the C builtins rather than a Python loop
+    unique_items = len(item_analysis_data)
+    item_volumes = list(map(itemgetter('total_parts'), item_analysis_data))
+    total_production = sum(item_volumes)
+    top_item_volume = max(item_volumes, default=0)
+    quality_sum = sum(map(itemgetter('quality_rate'), item_analysis_data))
+    avg_item_quality = round(quality_sum / unique_items, 1) if unique_items else 0
+    
+    # Build HTML structure, one section at a time
+    yield _HTML_HEAD
+    if config.get('external_css'):
+        yield f'    <link rel="stylesheet" href="{DASHBOARD_CSS_PATH.name}">\n'
+    else:
+        yield '    <style>'
+        yield _DASHBOARD_CSS
+        yield '</style>\n'
+    yield _HEADER_TEMPLATE.substitute(
+        last_updated=last_updated,
+        current_month_name=current_month_name
+    )
+    yield '        <div class="kpi-grid">'
+    for card in kpi_cards:
+        yield _KPI_CARD_TEMPLATE.substitute(card, period=current_month_name)
+    yield '\n        </div>\n        \n'
+    yield _ANALYTICS_TEMPLATE.substitute(current_month_name=current_month_name)
+    yield _ITEM_SECTION_TEMPLATE.substitute(
+        current_month_name=current_month_name,
+        unique_items=unique_items,
+        total_production=f"{total_production:,}",
+        avg_item_quality=avg_item_quality,
+        top_item_volume=f"{top_item_volume:,}"
+    )
+
+    yield f"""
+                    </tbody>
+                </table>
+            </div>
+        </div>
+        
+        <!-- Interactive Downtime Section -->
+        <div class="downtime-section">
+            <h2 class="section-title"><i class="fas fa-exclamation-triangle"></i> Interactive Downtime Analysis - {current_month_name}</h2>
+            
+            <div class="downtime-controls">
+                <div class="controls-grid">
+                    <div class="control-group">
+                        <label class="control-label">Select Machine</label>
+                        <select class="control-select" id="machineSelect">
+                            <option value="all">All Machines</option>"""
+
+    # Add real machine names from extracted data (show ALL machines), escaped for the markup
+    yield "".join(f"""
+                            <option value="{machine}">{machine}</option>""" for machine in map(escape, sorted_machines))
+
+    yield f"""
+                        </select>
+                    </div>
+                    <div class="control-group">
+                        <label class="control-label">Downtime Category</label>
+                        <select class="control-select" id="downtimeCategory">
+                            <option value="all">All Categories</option>"""
+
+    # Add real categories from extracted data, escaped for the markup
+    yield "".join(f"""
+                            <option value="{category}">{category}</option>""" for category in map(escape, sorted_categories))
+
+    yield f"""
+                        </select>
+                    </div>
+                    <div class="control-group">
+                        <label class="control-label">Time Period</label>
+                        <select class="control-select" id="timePeriod">
+                            <option value="week">Last 7 Days</option>
+                            <option value="month" selected>This Month</option>
+                            <option value="quarter">This Quarter</option>
+                        </select>
+                    </div>
+                    <div class="control-group">
+                        <button class="refresh-btn" onclick="updateDowntimeChart()">
+                            <i class="fas fa-sync-alt"></i> Update Analysis
+                        </button>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="downtime-stats">
+                <div class="downtime-stat">
+                    <div class="downtime-stat-value" id="totalDowntime">{current_month_total_downtime:.1f}h</div>
+                    <div class="downtime-stat-label">Total Downtime</div>
+                </div>
+                <div class="downtime-stat">
+                    <div class="downtime-stat-value" id="avgDowntime">{current_month_avg_downtime:.1f}h</div>
+                    <div class="downtime-stat-label">Average Daily</div>
+                </div>
+                <div class="downtime-stat">
+                    <div class="downtime-stat-value" id="maxDowntime">{current_month_peak_downtime:.1f}h</div>
+                    <div class="downtime-stat-label">Peak Daily</div>
+                </div>
+                <div class="downtime-stat">
+                    <div class="downtime-stat-value" id="downtimeReduction">Analysis</div>
+                    <div class="downtime-stat-label">Data Analysis</div>
+                </div>
+            </div>
+            
+            <div class="downtime-container">
+                <h3 class="chart-title">Machine Downtime Analysis</h3>
+                <div class="chart-wrapper">
+                    <canvas id="downtimeChart"></canvas>
+                </div>
+            </div>
+        </div>
+        
+        <div class="controls">
+            <h3 class="controls-title"><i class="fas fa-filter"></i> Advanced Filtering & Search</h3>
+            
+            <div class="date-filters">
+                <div class="date-selector">
+                    <div class="date-input-group">
+                        <label class="date-label" for="dateFrom">From Date</label>
+                        <input type="date" class="date-picker" id="dateFrom" title="Select start date">
+                    </div>
+                    <div class="date-input-group">
+                        <label class="date-label" for="dateTo">To Date</label>
+                        <input type="date" class="date-picker" id="dateTo" title="Select end date">
+                    </div>
+                </div>
+                
+                <div class="quick-filters">
+                    <button class="quick-filter-btn" onclick="setQuickDateRange('today')">
+                        <i class="fas fa-calendar-day"></i> Today
+                    </button>
+                    <button class="quick-filter-btn" onclick="setQuickDateRange('yesterday')">
+                        <i class="fas fa-history"></i> Yesterday
+                    </button>
+                    <button class="quick-filter-btn" onclick="setQuickDateRange('week')">
+                        <i class="fas fa-calendar-week"></i> This Week
+                    </button>
+                    <button class="quick-filter-btn" onclick="setQuickDateRange('lastweek')">
+                        <i class="fas fa-step-backward"></i> Last Week
+                    </button>
+                    <button class="quick-filter-btn" onclick="setQuickDateRange('month')">
+                        <i class="fas fa-calendar-alt"></i> This Month
+                    </button>
+                    <button class="quick-filter-btn" onclick="setQuickDateRange('lastmonth')">
+                        <i class="fas fa-backward"></i> Last Month
+                    </button>
+                </div>
+                
+                <button class="apply-filters-btn" onclick="filterByDateRange()">
+                    <i class="fas fa-search"></i> Apply Date Filter
+                </button>
+            </div>
+            
+            <div class="advanced-filters">
+                <button class="filter-btn active" onclick="filterReports('all')">
+                    <i class="fas fa-list"></i> All Reports
+                </button>
+                <button class="filter-btn" onclick="filterByOEE('good')">
+                    <i class="fas fa-thumbs-up"></i> Good OEE (≥70%)
+                </button>
+                <button class="filter-btn" onclick="filterByOEE('fair')">
+                    <i class="fas fa-balance-scale"></i> Fair OEE (45-69%)
+                </button>
+                <button class="filter-btn" onclick="filterByOEE('poor')">
+                    <i class="fas fa-exclamation-triangle"></i> Poor OEE (<45%)
+                </button>
+                <button class="filter-btn" onclick="filterByQuality('high')">
+                    <i class="fas fa-star"></i> High Quality (≥95%)
+                </button>
+            </div>
+            
+            <input type="text" class="search-box" id="searchInput" 
+                   placeholder="🔍 Search by date, OEE percentage, production metrics, or filename...">
+        </div>
+        
+        <div class="reports-container" id="reportsContainer">"""
+    
+    # Generate report cards with real data
+    for folder_name, folder_reports in folders.items():
+        # Add reports for this folder; the section carries every filter class its cards use
+        cards = []
+        section_classes = set()
+        for report in folder_reports:
+            main_oee = report['main_oee']
+            total_parts = report['total_parts']
+            ok_parts = report['ok_parts']
+            quality_rate = report['quality_rate']
+            downtime_hours = report['downtime_hours']
+            status = report['status']
+            
+            day_name, formatted_date = format_report_date(report['date'])
+            
+            # Format values and units for display
+            oee_display, oee_unit = (f"{main_oee:.1f}", '%') if main_oee is not None else ("N/A", '')
+            quality_display, quality_unit = (f"{quality_rate:.1f}", '%') if quality_rate is not None else ("N/A", '')
+            downtime_display, downtime_unit = (f"{downtime_hours:.1f}", 'h') if downtime_hours is not None else ("N/A", '')
+            
+            filter_classes = report_filter_classes(main_oee, quality_rate)
+            section_classes.update(filter_classes)
+            
+            cards.append(_REPORT_CARD_TEMPLATE.format(
+                filter_classes="".join(f" {name}" for name in filter_classes),
+                date=report['date'],
+                title=report['title'],
+                filename=report['filename'],
+                sharepoint_url=report['sharepoint_url'],
+                day_name=day_name,
+                status=status,
+                status_lower=status.lower(),
+                status_upper=status.upper(),
+                oee_display=oee_display,
+                oee_unit=oee_unit,
+                parts_display=f"{total_parts:,}" if total_parts is not None else "N/A",
+                ok_display=f"{ok_parts:,}" if ok_parts is not None else "N/A",
+                quality_display=quality_display,
+                quality_unit=quality_unit,
+                downtime_display=downtime_display,
+                downtime_unit=downtime_unit
+            ))
+        
+        yield f"""
+        <div class="folder-section{"".join(f" {name}" for name in sorted(section_classes))}" data-folder="{folder_name}">
+            <div class="folder-header">
+                <div class="folder-title">
+                    <i class="fas fa-folder-open"></i>
+                    {folder_name} ({len(folder_reports)} reports)
+                </div>
+            </div>
+            <div class="reports-grid">"""
+        yield "".join(cards)
+        
+        yield """
+            </div>
+        </div>"""
+    
+    # Complete the HTML with JavaScript
+    yield _SCRIPT_TEMPLATE.substitute(
+        monthly_oee_json=monthly_oee_json,
+        monthly_parts_json=monthly_parts_json,
+        downtime_breakdown_json=downtime_breakdown_json,
+        machine_downtime_json=machine_downtime_json,
+        current_month_reports_json=current_month_reports_json,
+        category_breakdown_json=category_breakdown_json,
+        machine_oee_json=machine_oee_json,
+        item_analysis_json=item_analysis_json
+    )
     
-    return html
 
 def show_success(output_file, report_count, config):
     """Show success message"""